@@ -4,6 +4,8 @@
 """
 from api.v1.views import app_views
 from flask import abort, jsonify, request
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import list_response
 from models import storage, CNC
 from flasgger.utils import swag_from
 
@@ -15,9 +17,7 @@ def amenities_no_id(amenity_id=None):
         amenities route that handles http requests no ID given
     """
     if request.method == 'GET':
-        all_amenities = storage.all('Amenity')
-        all_amenities = [obj.to_json() for obj in all_amenities.values()]
-        return jsonify(all_amenities)
+        return list_response('Amenity')
 
     if request.method == 'POST':
         req_json = request.get_json()
@@ -42,7 +42,7 @@ def amenities_with_id(amenity_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        return jsonify(amenity_obj.to_json())
+        return object_response(amenity_obj)
 
     if request.method == 'DELETE':
         amenity_obj.delete()
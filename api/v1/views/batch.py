@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+"""
+Flask route that applies a batch of create, update and delete operations
+"""
+from api.v1.views import app_views
+from flask import abort, jsonify, request
+from models import storage, CNC
+from os import environ
+
+BATCH_MAX = int(environ.get('HBNB_BATCH_MAX') or 10000)
+"""BATCH_MAX - most operations accepted in one batch request"""
+REQUIRED = {
+    'Amenity': ('name',),
+    'City': ('state_id', 'name'),
+    'Place': ('city_id', 'user_id', 'name'),
+    'Review': ('place_id', 'user_id', 'text'),
+    'State': ('name',),
+    'User': ('email', 'password')
+}
+"""REQUIRED - attributes a create operation must give, per Class Name"""
+REFERENCES = {
+    'City': (('state_id', 'State'),),
+    'Place': (('city_id', 'City'), ('user_id', 'User')),
+    'Review': (('place_id', 'Place'), ('user_id', 'User'))
+}
+"""REFERENCES - (attribute, Class Name) of the objects a new one refers to"""
+
+
+class Batch:
+    """
+        validates batch operations against storage and the operations
+        before them, then applies them with a single storage save
+    """
+
+    def __init__(self):
+        """
+            starts an empty batch
+        """
+        self.__created = {}
+        self.__deleted = set()
+        self.__stored = {}
+        self.__operations = []
+
+    def __lookup(self, cls, obj_id):
+        """
+            private: returns the object as the batch has left it so far
+        """
+        key = '{}.{}'.format(cls, obj_id)
+        if key in self.__deleted:
+            return None
+        if key in self.__created:
+            return self.__created[key]
+        if key not in self.__stored:
+            self.__stored[key] = storage.get(cls, obj_id)
+        return self.__stored[key]
+
+    def check(self, operation):
+        """
+            returns None if operation can be applied after the operations
+            checked before it, else its (status, error message)
+        """
+        if not isinstance(operation, dict):
+            return 400, 'Not a JSON'
+        method = operation.get('method')
+        cls = operation.get('class')
+        data = operation.get('data') or {}
+        if method not in ('POST', 'PUT', 'DELETE'):
+            return 400, 'Invalid method'
+        if cls not in REQUIRED:
+            return 400, 'Invalid class'
+        if not isinstance(data, dict):
+            return 400, 'Not a JSON'
+        if method == 'POST':
+            for attr in REQUIRED[cls]:
+                if data.get(attr) is None:
+                    return 400, 'Missing {}'.format(attr)
+            for attr, ref_cls in REFERENCES.get(cls, ()):
+                if self.__lookup(ref_cls, data[attr]) is None:
+                    return 404, 'Not found'
+            key = '{}.{}'.format(cls, data.get('id'))
+            if data.get('id') is not None and (
+                    key in self.__created or storage.get(cls, data['id'])):
+                return 400, 'Duplicate id'
+            try:
+                obj = CNC[cls](**data)
+            except (TypeError, ValueError):
+                return 400, 'Invalid data'
+            self.__created['{}.{}'.format(cls, obj.id)] = obj
+            self.__operations.append((method, obj, None))
+            return None
+        obj = self.__lookup(cls, operation.get('id'))
+        if obj is None:
+            return 404, 'Not found'
+        key = '{}.{}'.format(cls, obj.id)
+        if method == 'DELETE' and key in self.__created:
+            return 400, 'Created in this batch'
+        if method == 'DELETE':
+            self.__deleted.add(key)
+        self.__operations.append((method, obj, data))
+        return None
+
+    def apply(self):
+        """
+            applies the checked operations in one storage transaction,
+            returns the results of the operations
+        """
+        results = []
+        with storage.transaction():
+            for method, obj, data in self.__operations:
+                if method == 'POST':
+                    obj.save()
+                    results.append({'status': 201, 'object': obj})
+                elif method == 'PUT':
+                    obj.bm_update(data)
+                    results.append({'status': 200, 'object': obj})
+                else:
+                    obj.delete()
+                    results.append({'status': 200, 'object': {}})
+        for result in results:
+            if result['object']:
+                result['object'] = result['object'].to_json()
+        return results
+
+
+@app_views.route('/batch', methods=['POST'])
+def batch():
+    """
+        batch route to apply a list of create, update and delete operations
+        together; nothing is applied if one of them is invalid
+    """
+    req_json = request.get_json()
+    if req_json is None:
+        abort(400, 'Not a JSON')
+    if not isinstance(req_json, list):
+        abort(400, 'Not a list')
+    if len(req_json) > BATCH_MAX:
+        abort(400, 'Too many operations')
+    a_batch = Batch()
+    errors = [a_batch.check(operation) for operation in req_json]
+    if any(errors):
+        results = [{'status': 424, 'error': 'Not applied'} if e is None
+                   else {'status': e[0], 'error': e[1]} for e in errors]
+        return jsonify(results), 400
+    return jsonify(a_batch.apply()), 200
@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+"""
+In-process LRU cache of the GET responses of the app_views routes
+
+Off unless HBNB_API_CACHE sets how many responses it keeps. Responses are
+keyed by path, query string and format, and tagged by the helpers that
+build them with the class names and <class name>.<id> keys they show.
+BaseModel.save() drops every response tagged with the class or key of the
+saved object, and BaseModel.delete() drops them all. Streamed responses are
+not kept.
+
+The cache is per process. File storage drops it all when it loads objects
+another process wrote; with DBStorage, writes of other workers are only
+seen once a response expires, HBNB_API_CACHE_TTL seconds after it was
+stored (default 5, 0 keeps responses until they are invalidated, which is
+only safe with a single worker process).
+"""
+import threading
+import time
+from api.v1.views import app_views
+from api.v1.views.streaming import wants_ndjson
+from collections import OrderedDict
+from flask import Response, g, request
+from models.base_model import BaseModel
+from models.engine.file_storage import FileStorage
+from os import environ
+
+
+class ResponseCache:
+    """
+        bounded LRU of responses, invalidated by tags
+    """
+
+    def __init__(self, size=0, ttl=0):
+        """
+            creates a cache keeping up to size responses, 0 disables it,
+            for ttl seconds each, 0 until they are invalidated
+        """
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.version = 0
+        self.__entries = OrderedDict()
+        self.__tags = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+            returns the entry stored under key and marks it recently used,
+            None if there is none
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[2] and entry[2] < time.time():
+                self.__remove(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, tags, version):
+        """
+            stores value under key with its tags, unless something was
+            invalidated since the cache was at version
+        """
+        with self.__lock:
+            if version != self.version or not self.size:
+                return
+            self.__remove(key)
+            expires = time.time() + self.ttl if self.ttl else 0
+            self.__entries[key] = (value, tuple(tags), expires)
+            for tag in tags:
+                self.__tags.setdefault(tag, set()).add(key)
+            while len(self.__entries) > self.size:
+                self.__remove(next(iter(self.__entries)))
+                self.evictions += 1
+
+    def invalidate(self, *tags):
+        """
+            drops every entry tagged with one of tags
+        """
+        with self.__lock:
+            self.version += 1
+            for tag in tags:
+                for key in list(self.__tags.get(tag, ())):
+                    self.__remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        """
+            drops every entry
+        """
+        with self.__lock:
+            self.version += 1
+            self.invalidations += len(self.__entries)
+            self.__entries.clear()
+            self.__tags.clear()
+
+    def stats(self):
+        """
+            returns the cache counters
+        """
+        with self.__lock:
+            return {
+                'size': self.size,
+                'entries': len(self.__entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+    def __remove(self, key):
+        """
+            private: drops the entry under key and its tags
+        """
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            for tag in entry[1]:
+                keys = self.__tags[tag]
+                keys.discard(key)
+                if not keys:
+                    del self.__tags[tag]
+
+
+response_cache = ResponseCache(int(environ.get('HBNB_API_CACHE') or 0),
+                               float(environ.get('HBNB_API_CACHE_TTL') or 5))
+
+
+def invalidate_obj(obj, deleted):
+    """
+        drops the cached responses showing obj or its class, or every
+        response if obj was deleted: deletes may cascade to other objects
+    """
+    if deleted:
+        response_cache.clear()
+    else:
+        cls_name = type(obj).__name__
+        response_cache.invalidate(cls_name,
+                                  '{}.{}'.format(cls_name, obj.id))
+
+
+BaseModel.CHANGE_HOOKS.append(invalidate_obj)
+FileStorage.RELOAD_HOOKS.append(response_cache.clear)
+
+
+def tag(*tags):
+    """
+        tags the response of the current request, only tagged responses
+        are cached
+    """
+    cache_tags = g.get('cache_tags')
+    if cache_tags is not None:
+        cache_tags.update(tags)
+
+
+@app_views.before_request
+def cached_response():
+    """
+        answers GET requests from the response cache
+    """
+    if request.method != 'GET' or not response_cache.size:
+        return None
+    g.cache_key = (request.path, request.query_string, wants_ndjson())
+    g.cache_version = response_cache.version
+    g.cache_tags = set()
+    value = response_cache.get(g.cache_key)
+    if value is None:
+        return None
+    g.cache_tags = None
+    status, headers, body = value
+    response = Response(body, status=status, headers=headers)
+    return response.make_conditional(request)
+
+
+@app_views.after_request
+def cache_response(response):
+    """
+        stores tagged GET responses in the response cache
+    """
+    tags = g.get('cache_tags')
+    if tags and response.status_code == 200 and not response.is_streamed:
+        headers = [(k, v) for k, v in response.headers
+                   if k != 'Content-Length']
+        response_cache.put(g.cache_key,
+                           (200, headers, response.get_data()),
+                           tags, g.cache_version)
+    return response
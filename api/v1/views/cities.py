@@ -4,6 +4,8 @@ Flask route that returns json status response
 """
 from api.v1.views import app_views
 from flask import abort, jsonify, request
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import list_response
 from models import storage, CNC
 from flasgger.utils import swag_from
 
@@ -19,10 +21,7 @@ def cities_per_state(state_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        all_cities = storage.all('City')
-        state_cities = [obj.to_json() for obj in all_cities.values()
-                        if obj.state_id == state_id]
-        return jsonify(state_cities)
+        return list_response('City', 'state_id', state_obj)
 
     if request.method == 'POST':
         req_json = request.get_json()
@@ -48,7 +47,7 @@ def cities_with_id(city_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        return jsonify(city_obj.to_json())
+        return object_response(city_obj)
 
     if request.method == 'DELETE':
         city_obj.delete()
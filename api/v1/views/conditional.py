@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""
+Conditional GET for the API routes
+
+Object routes send an ETag made from the object id and updated_at, and
+updated_at as Last-Modified. List routes send an ETag made from the
+request itself and from the storage generation of the listed class, or
+the ids and updated_at of the objects of a page, but no Last-Modified:
+deleting an object does not move the latest updated_at. A request whose
+If-None-Match (or, without one, whose If-Modified-Since) shows the client
+has the current representation gets an empty 304 before anything is
+serialized.
+
+Every worker process computes the same ETags: the storage generation is
+the count and latest updated_at of the rows with DBStorage, and the
+signature of the JSON files with FileStorage. A FileStorage worker holding
+changes it has not saved, or that appended to a journal another process
+had written to since it last read it, falls back to a version of its own
+until it reloads, so its list ETags only match on that worker meanwhile.
+"""
+from api.v1.views.cache import tag
+from flask import Response, jsonify, request
+from hashlib import sha1
+
+
+def make_etag(*parts):
+    """
+        returns an entity tag for the representation described by parts
+    """
+    return sha1('|'.join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+
+def not_modified(etag, last_modified=None):
+    """
+        returns a 304 response if the request conditions match etag or
+        last_modified, else None
+    """
+    if request.if_none_match:
+        fresh = request.if_none_match.contains_weak(etag)
+    elif last_modified is not None and request.if_modified_since:
+        since = request.if_modified_since.replace(tzinfo=None)
+        fresh = last_modified.replace(microsecond=0) <= since
+    else:
+        fresh = False
+    if fresh:
+        return validated(Response(status=304), etag, last_modified)
+    return None
+
+
+def validated(response, etag, last_modified=None):
+    """
+        returns response with its ETag and Last-Modified headers set
+    """
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+def object_response(obj):
+    """
+        returns the json response of obj, or 304 if the client has it
+    """
+    tag('{}.{}'.format(type(obj).__name__, obj.id))
+    last_modified = getattr(obj, 'updated_at', obj.created_at)
+    etag = make_etag(type(obj).__name__, obj.id, last_modified)
+    response = not_modified(etag, last_modified)
+    if response is None:
+        response = validated(jsonify(obj.to_json()), etag, last_modified)
+    return response
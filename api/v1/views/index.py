@@ -3,6 +3,7 @@
 Flask route that returns json status response
 """
 from api.v1.views import app_views
+from api.v1.views.cache import response_cache
 from flask import jsonify, request
 from models import storage
 
@@ -32,6 +33,17 @@ def stats():
             "State": "states",
             "User": "users"
         }
+        counts = storage.count_by_class(list(PLURALS.keys()))
         for key, value in PLURALS.items():
-            response[value] = storage.count(key)
+            response[value] = counts[key]
         return jsonify(response)
+
+
+@app_views.route('/diagnostics', methods=['GET'])
+def diagnostics():
+    """
+    function to return the counters of the API internals
+    """
+    if request.method == 'GET':
+        return jsonify({'response_cache': response_cache.stats(),
+                        'db_pool': storage.pool_stats()})
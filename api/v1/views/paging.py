@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""
+Cursor pagination shared by the list routes
+
+A list route is paginated when the request has a limit or a cursor query
+argument. The cursor is an opaque token naming the (created_at, id) of the
+last object of the previous page, the next one is sent back in the
+X-Next-Cursor and Link headers while the page is full.
+"""
+from api.v1.views.cache import tag
+from api.v1.views.conditional import make_etag, not_modified, validated
+from api.v1.views.streaming import STREAM_MIN, stream_response, wants_ndjson
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from flask import abort, jsonify, request
+from models import storage
+from os import environ
+from urllib.parse import urlencode
+
+PAGE_SIZE = int(environ.get('HBNB_PAGE_SIZE') or 100)
+
+
+def page_args():
+    """
+        returns (limit, after) from the limit and cursor query arguments,
+        (None, None) if the request is not paginated
+    """
+    limit = request.args.get('limit')
+    cursor = request.args.get('cursor')
+    if limit is None and cursor is None:
+        return None, None
+    try:
+        limit = PAGE_SIZE if limit is None else int(limit)
+    except ValueError:
+        abort(400, 'Invalid limit')
+    if limit < 1:
+        abort(400, 'Invalid limit')
+    if not cursor:
+        return limit, None
+    return limit, decode_cursor(cursor)
+
+
+def encode_cursor(obj):
+    """
+        returns the cursor of the page that starts after obj
+    """
+    token = '{}|{}'.format(obj.created_at, obj.id)
+    return urlsafe_b64encode(token.encode('utf-8')).decode('ascii').rstrip(
+        '=')
+
+
+def decode_cursor(cursor):
+    """
+        returns the (created_at, id) tuple named by cursor, aborts with 400
+        if the cursor was not made by encode_cursor
+    """
+    try:
+        token = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, obj_id = token.decode('utf-8').split('|', 1)
+        if '.' in created_at:
+            created_at = datetime.strptime(created_at,
+                                           "%Y-%m-%d %H:%M:%S.%f")
+        else:
+            created_at = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        abort(400, 'Invalid cursor')
+    return created_at, obj_id
+
+
+def page_response(objs, limit):
+    """
+        returns the json response for one page of objs, with the next page
+        cursor in the headers when the page is full
+    """
+    if wants_ndjson():
+        response = stream_response(objs)
+    else:
+        response = jsonify([obj.to_json() for obj in objs])
+    if len(objs) == limit:
+        cursor = encode_cursor(objs[-1])
+        args = request.args.to_dict()
+        args.update(limit=limit, cursor=cursor)
+        next_url = '{}?{}'.format(request.base_url, urlencode(args))
+        response.headers['Link'] = '<{}>; rel="next"'.format(next_url)
+        response.headers['X-Next-Cursor'] = cursor
+    return response
+
+
+def list_response(cls, attr=None, parent=None):
+    """
+        returns the json list of cls objects, only those whose attribute
+        attr is the id of parent if attr is given, one page of it if the
+        request is paginated, streamed if it is long, or 304 if the
+        client has it; the ETag of a page is made from the ids and
+        updated_at of its objects, of a full list from the storage
+        generation of cls
+    """
+    value = None
+    tag(cls)
+    if parent is not None:
+        value = parent.id
+        tag('{}.{}'.format(type(parent).__name__, parent.id))
+    limit, after = page_args()
+    if limit is not None:
+        objs = storage.page(cls, limit, after, attr, value)
+        count = len(objs)
+        version = [(obj.id, getattr(obj, 'updated_at', obj.created_at))
+                   for obj in objs]
+    else:
+        count, version = storage.generation(cls, attr, value)
+    etag = make_etag(cls, attr, value, count, version, request.full_path,
+                     wants_ndjson())
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    if limit is not None:
+        response = page_response(objs, limit)
+    elif attr is None:
+        response = objs_response(storage.iter(cls), count)
+    else:
+        objs = storage.by_fk(cls, attr, value)
+        response = objs_response(objs.values(), len(objs))
+    return validated(response, etag)
+
+
+def objs_response(objs, count):
+    """
+        returns the json list of the count objs, streamed if the client
+        wants NDJSON or count is over STREAM_MIN
+    """
+    if count > STREAM_MIN or wants_ndjson():
+        return stream_response(objs)
+    return jsonify([obj.to_json() for obj in objs])
@@ -5,9 +5,10 @@ Flask route that returns json status response
 from api.v1.views import app_views
 from flask import abort, jsonify, request
 from flasgger.utils import swag_from
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import (page_args, page_response, list_response,
+                                 objs_response)
 from models import storage, CNC
-from os import environ
-STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
 
 
 @swag_from('swagger_yaml/places_by_city.yml', methods=['GET', 'POST'])
@@ -21,10 +22,7 @@ def places_per_city(city_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        all_places = storage.all('Place')
-        city_places = [obj.to_json() for obj in all_places.values()
-                       if obj.city_id == city_id]
-        return jsonify(city_places)
+        return list_response('Place', 'city_id', city_obj)
 
     if request.method == 'POST':
         req_json = request.get_json()
@@ -56,7 +54,7 @@ def places_with_id(place_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        return jsonify(place_obj.to_json())
+        return object_response(place_obj)
 
     if request.method == 'DELETE':
         place_obj.delete()
@@ -76,41 +74,25 @@ def places_search():
     """
         places route to handle http method for request to search places
     """
-    all_places = [p for p in storage.all('Place').values()]
     req_json = request.get_json()
-    if req_json is None:
+    if not isinstance(req_json, dict):
         abort(400, 'Not a JSON')
-    states = req_json.get('states')
-    if states and len(states) > 0:
-        all_cities = storage.all('City')
-        state_cities = set([city.id for city in all_cities.values()
-                            if city.state_id in states])
-    else:
-        state_cities = set()
-    cities = req_json.get('cities')
-    if cities and len(cities) > 0:
-        cities = set([
-            c_id for c_id in cities if storage.get('City', c_id)])
-        state_cities = state_cities.union(cities)
-    amenities = req_json.get('amenities')
-    if len(state_cities) > 0:
-        all_places = [p for p in all_places if p.city_id in state_cities]
-    elif amenities is None or len(amenities) == 0:
-        result = [place.to_json() for place in all_places]
-        return jsonify(result)
-    places_amenities = []
-    if amenities and len(amenities) > 0:
-        amenities = set([
-            a_id for a_id in amenities if storage.get('Amenity', a_id)])
-        for p in all_places:
-            p_amenities = None
-            if STORAGE_TYPE == 'db' and p.amenities:
-                p_amenities = [a.id for a in p.amenities]
-            elif len(p.amenities) > 0:
-                p_amenities = p.amenities
-            if p_amenities and all([a in p_amenities for a in amenities]):
-                places_amenities.append(p)
-    else:
-        places_amenities = all_places
-    result = [place.to_json() for place in places_amenities]
-    return jsonify(result)
+    limit, after = page_args()
+    places = storage.search_places(search_ids(req_json, 'states'),
+                                   search_ids(req_json, 'cities'),
+                                   search_ids(req_json, 'amenities'),
+                                   limit, after)
+    if limit is not None:
+        return page_response(places, limit)
+    return objs_response(places, len(places))
+
+
+def search_ids(req_json, key):
+    """
+        returns the string ids listed under key in req_json, ignoring
+        other values as they name no object
+    """
+    ids = req_json.get(key)
+    if not isinstance(ids, list):
+        return None
+    return [obj_id for obj_id in ids if isinstance(obj_id, str)]
@@ -14,21 +14,18 @@ def amenities_per_place(place_id=None):
     """
         reviews route to handle http method for requested reviews by place
     """
-    place_obj = storage.get('Place', place_id)
+    place_obj = storage.get('Place', place_id, with_related=['amenities'])
 
     if request.method == 'GET':
         if place_obj is None:
             abort(404, 'Not found')
-        all_amenities = storage.all('Amenity')
         if STORAGE_TYPE == 'db':
             place_amenities = place_obj.amenities
         else:
-            place_amen_ids = place_obj.amenities
-            place_amenities = []
-            for amen in place_amen_ids:
-                response.append(storage.get('Amenity', amen))
+            place_amenities = [storage.get('Amenity', amen)
+                               for amen in place_obj.amenity_ids]
         place_amenities = [
-            obj.to_json() for obj in place_amenities
+            obj.to_json() for obj in place_amenities if obj is not None
             ]
         return jsonify(place_amenities)
 
@@ -39,30 +36,38 @@ def amenity_to_place(place_id=None, amenity_id=None):
     """
         reviews route to handle http methods for given review by ID
     """
-    place_obj = storage.get('Place', place_id)
+    place_obj = storage.get('Place', place_id, with_related=['amenities'])
     amenity_obj = storage.get('Amenity', amenity_id)
     if place_obj is None:
         abort(404, 'Not found')
     if amenity_obj is None:
         abort(404, 'Not found')
 
+    if STORAGE_TYPE == 'db':
+        linked = amenity_obj in place_obj.amenities
+    else:
+        linked = amenity_obj.id in place_obj.amenity_ids
+
     if request.method == 'DELETE':
-        if (amenity_obj not in place_obj.amenities and
-                amenity_obj.id not in place_obj.amenities):
+        if not linked:
             abort(404, 'Not found')
-        if STORAGE_TYPE == 'db':
-            place_obj.amenities.remove(amenity_obj)
-        else:
-            place_obj.amenity_ids.pop(amenity_obj.id, None)
-        place_obj.save()
+        with storage.transaction():
+            if STORAGE_TYPE == 'db':
+                place_obj.amenities.remove(amenity_obj)
+            else:
+                place_obj.amenity_ids = [
+                    amen for amen in place_obj.amenity_ids
+                    if amen != amenity_obj.id]
+            place_obj.save()
         return jsonify({}), 200
 
     if request.method == 'POST':
-        if (amenity_obj in place_obj.amenities or
-                amenity_obj.id in place_obj.amenities):
+        if linked:
             return jsonify(amenity_obj.to_json()), 200
-        if STORAGE_TYPE == 'db':
-            place_obj.amenities.append(amenity_obj)
-        else:
-            place_obj.amenities = amenity_obj
+        with storage.transaction():
+            if STORAGE_TYPE == 'db':
+                place_obj.amenities.append(amenity_obj)
+            else:
+                place_obj.amenities = amenity_obj
+            place_obj.save()
         return jsonify(amenity_obj.to_json()), 201
@@ -5,6 +5,8 @@ Flask route that returns json status response
 from api.v1.views import app_views
 from flask import abort, jsonify, request
 from flasgger.utils import swag_from
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import list_response
 from models import storage, CNC
 
 
@@ -19,10 +21,7 @@ def reviews_per_place(place_id=None):
     if request.method == 'GET':
         if place_obj is None:
             abort(404, 'Not found')
-        all_reviews = storage.all('Review')
-        place_reviews = [obj.to_json() for obj in all_reviews.values()
-                         if obj.place_id == place_id]
-        return jsonify(place_reviews)
+        return list_response('Review', 'place_id', place_obj)
 
     if request.method == 'POST':
         if place_obj is None:
@@ -56,7 +55,7 @@ def reviews_with_id(review_id=None):
     if request.method == 'GET':
         if review_obj is None:
             abort(404, 'Not found')
-        return jsonify(review_obj.to_json())
+        return object_response(review_obj)
 
     if request.method == 'DELETE':
         if review_obj is None:
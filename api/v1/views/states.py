@@ -5,6 +5,8 @@ Flask route that returns json status response
 from api.v1.views import app_views
 from flask import abort, jsonify, make_response, request
 from flasgger import Swagger, swag_from
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import list_response
 from models import storage, CNC
 
 
@@ -15,9 +17,7 @@ def states_no_id():
         states route to handle http method for requested states no id provided
     """
     if request.method == 'GET':
-        all_states = storage.all('State')
-        all_states = list(obj.to_json() for obj in all_states.values())
-        return jsonify(all_states)
+        return list_response('State')
 
     if request.method == 'POST':
         req_json = request.get_json()
@@ -42,7 +42,7 @@ def states_with_id(state_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        return jsonify(state_obj.to_json())
+        return object_response(state_obj)
 
     if request.method == 'DELETE':
         state_obj.delete()
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""
+Streamed list responses
+
+Lists longer than HBNB_STREAM_MIN objects are sent as a chunked JSON array,
+serialized a few objects at a time instead of in one jsonify call. Clients
+that accept application/x-ndjson get one JSON object per line instead, for
+lists of any length.
+"""
+import json
+from flask import Response, request, stream_with_context
+from os import environ
+
+STREAM_MIN = int(environ.get('HBNB_STREAM_MIN') or 1000)
+CHUNK_SIZE = 100
+NDJSON = 'application/x-ndjson'
+
+
+def wants_ndjson():
+    """
+        returns True if the client prefers NDJSON to a JSON array
+    """
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON])
+    return best == NDJSON
+
+
+def stream_response(objs):
+    """
+        returns a streamed response of the objs iterable, as NDJSON if the
+        client prefers it, else as a JSON array
+    """
+    ndjson = wants_ndjson()
+
+    def generate():
+        """yields the serialized objects CHUNK_SIZE at a time"""
+        dumps = json.dumps
+        head, sep = ('', '\n') if ndjson else ('[', ',')
+        chunk = []
+        for obj in objs:
+            chunk.append(dumps(obj.to_json()))
+            if len(chunk) == CHUNK_SIZE:
+                yield head + sep.join(chunk)
+                head = sep
+                chunk = []
+        if chunk:
+            yield head + sep.join(chunk)
+            head = sep
+        if not ndjson:
+            yield '[]\n' if head == '[' else ']\n'
+        elif head == sep:
+            yield '\n'
+
+    mimetype = NDJSON if ndjson else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
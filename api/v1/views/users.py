@@ -4,6 +4,8 @@
 """
 from api.v1.views import app_views
 from flask import abort, jsonify, request
+from api.v1.views.conditional import object_response
+from api.v1.views.paging import list_response
 from models import storage, CNC
 from flasgger.utils import swag_from
 
@@ -16,9 +18,7 @@ def users_no_id(user_id=None):
     """
 
     if request.method == 'GET':
-        all_users = storage.all('User')
-        all_users = [obj.to_json() for obj in all_users.values()]
-        return jsonify(all_users)
+        return list_response('User')
 
     if request.method == 'POST':
         req_json = request.get_json()
@@ -45,7 +45,7 @@ def user_with_id(user_id=None):
         abort(404, 'Not found')
 
     if request.method == 'GET':
-        return jsonify(user_obj.to_json())
+        return object_response(user_obj)
 
     if request.method == 'DELETE':
         user_obj.delete()
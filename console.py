@@ -199,16 +199,10 @@ class HBNBCommand(cmd.Cmd):
             if error:
                 return
         print('[', end='')
-        l = 0
-        if arg:
-            storage_objs = storage.all(arg[0])
-        else:
-            storage_objs = storage.all()
-        l = len(storage_objs)
-        c = 0
-        for v in storage_objs.values():
-            c += 1
-            print(v, end=(', ' if c < l else ''))
+        sep = ''
+        for v in storage.iter(arg[0] if arg else None):
+            print(sep + str(v), end='')
+            sep = ', '
         print(']')
 
     def do_destroy(self, arg):
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""
+Benchmark: importing synthetic states and cities, one save() per object,
+one save() per batch, and bulk_new() / bulk_save()
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/bulk_import.py [COUNT [MODE ...]]
+
+COUNT defaults to 10000 rows, one state for every 99 cities; MODE is any
+of save, session, bulk (default all three). Pass `1000000 bulk` for the 1M
+row import, the save mode commits once per row so keep COUNT small for it.
+Rows are created BATCH at a time so memory stays bounded. Uses whichever
+storage engine HBNB_TYPE_STORAGE selects: file storage runs inside a
+temporary directory so ./dev/file.json is left alone; in db mode point
+HBNB_DB_URL or the HBNB_MYSQL_* variables at a scratch database, rows are
+inserted for real. HBNB_DB_BULK_CHUNK sets the rows per INSERT.
+"""
+import os
+import sys
+import tempfile
+import time
+from models import storage, CNC
+
+BATCH = 100000
+STORAGE_TYPE = os.environ.get('HBNB_TYPE_STORAGE')
+
+
+def rows(count):
+    """yields lists of up to BATCH new states and cities, count in all"""
+    batch = []
+    state = None
+    for i in range(count):
+        if i % 100 == 0:
+            state = CNC['State'](name="State {}".format(i))
+            batch.append(state)
+        else:
+            batch.append(CNC['City'](name="City {}".format(i),
+                                     state_id=state.id))
+        if len(batch) == BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load(count, mode):
+    """imports count rows the mode way, returns elapsed seconds"""
+    start = time.perf_counter()
+    for batch in rows(count):
+        if mode == 'bulk':
+            storage.bulk_new(batch)
+            storage.bulk_save()
+        else:
+            for obj in batch:
+                storage.new(obj)
+                if mode == 'save':
+                    storage.save()
+            storage.save()
+        storage.close()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    modes = sys.argv[2:] or ['save', 'session', 'bulk']
+    if STORAGE_TYPE != 'db':
+        os.chdir(tempfile.mkdtemp())
+        os.mkdir('dev')
+    print("{:>10} {:>10} {:>12} {:>12}".format(
+        "mode", "rows", "seconds", "rows/s"))
+    for mode in modes:
+        before = storage.count('State') + storage.count('City')
+        elapsed = load(count, mode)
+        after = storage.count('State') + storage.count('City')
+        assert after - before == count
+        print("{:>10} {:>10} {:>12.3f} {:>12.0f}".format(
+            mode, count, elapsed, count / elapsed))
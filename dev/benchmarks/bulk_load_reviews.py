@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""
+Benchmark: creating and saving reviews one at a time in FileStorage,
+full snapshot rewrites versus the append-only journal
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/bulk_load_reviews.py [COUNT [MODE ...]]
+
+COUNT defaults to 1000, MODE is any of snapshot, journal (default both).
+Snapshot mode is quadratic, keep COUNT small for it; try
+`100000 journal` for the bulk load case. Runs inside a temporary
+directory so ./dev/file.json is left alone.
+"""
+import os
+import sys
+import tempfile
+import time
+from models import storage, CNC
+from models.engine.file_storage import FileStorage
+
+
+def load(count):
+    """saves `count` reviews one by one, returns elapsed seconds"""
+    storage.delete_all()
+    start = time.perf_counter()
+    for i in range(count):
+        review = CNC['Review'](text="review {}".format(i),
+                               place_id="bench-place", user_id="bench-user")
+        review.save()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    modes = sys.argv[2:] or ['snapshot', 'journal']
+    os.chdir(tempfile.mkdtemp())
+    os.mkdir('dev')
+    print("{:>10} {:>10} {:>12} {:>12}".format(
+        "mode", "reviews", "seconds", "reload (s)"))
+    for mode in modes:
+        FileStorage.JOURNAL = mode == 'journal'
+        elapsed = load(count)
+        start = time.perf_counter()
+        storage.reload()
+        reload_s = time.perf_counter() - start
+        assert storage.count('Review') == count
+        print("{:>10} {:>10} {:>12.3f} {:>12.3f}".format(
+            mode, count, elapsed, reload_s))
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+"""
+Benchmark: FileStorage save throughput under each HBNB_FILE_FSYNC policy,
+for both snapshot rewrites and the append-only journal
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/fsync_policies.py [SAVES [POLICY ...]]
+
+SAVES defaults to 500, POLICY defaults to: never 100 10 always
+(a number is the fsync interval in milliseconds). Each run starts from a
+store of 1000 states. Runs inside a temporary directory so ./dev/file.json
+is left alone; point TMPDIR at the disk you want to measure.
+"""
+import os
+import sys
+import tempfile
+import time
+from models import storage, CNC
+from models.engine.file_storage import FileStorage
+
+BASE_OBJECTS = 1000
+
+
+def run(saves):
+    """saves `saves` new states one by one, returns saves per second"""
+    storage.delete_all()
+    for i in range(BASE_OBJECTS):
+        storage.new(CNC['State'](name="base {}".format(i)))
+    storage.compact()
+    start = time.perf_counter()
+    for i in range(saves):
+        CNC['State'](name="state {}".format(i)).save()
+    return saves / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    saves = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    policies = sys.argv[2:] or ['never', '100', '10', 'always']
+    os.chdir(tempfile.mkdtemp())
+    os.mkdir('dev')
+    print("{:>10} {:>10} {:>14}".format("mode", "fsync", "saves/s"))
+    for journal in [False, True]:
+        FileStorage.JOURNAL = journal
+        for policy in policies:
+            FileStorage.FSYNC = policy
+            print("{:>10} {:>10} {:>14.1f}".format(
+                'journal' if journal else 'snapshot', policy, run(saves)))
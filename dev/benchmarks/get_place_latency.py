@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""
+Benchmark: latency of GET /api/v1/places/<place_id> as the places table grows
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/get_place_latency.py [SIZE ...]
+
+SIZE defaults to 1000 10000 100000 (pass 1000000 for the 1M row run).
+Uses whichever storage engine HBNB_TYPE_STORAGE selects. File storage is
+only grown in memory; in db mode point the HBNB_MYSQL_* variables at a
+scratch database, rows are inserted for real.
+"""
+import sys
+import time
+from os import environ
+from api.v1.app import app
+from api.v1.views.places import places_with_id
+from models import storage, CNC
+
+REPEAT = 2000
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
+
+
+def grow(target):
+    """adds places until the store holds `target` of them, returns one id"""
+    state = CNC['State'](name="Bench")
+    storage.new(state)
+    city = CNC['City'](name="Bench", state_id=state.id)
+    storage.new(city)
+    user = CNC['User'](email="bench@hbnb.io", password="bench")
+    storage.new(user)
+    place = None
+    for i in range(storage.count('Place'), target):
+        place = CNC['Place'](name="place {}".format(i),
+                             city_id=city.id, user_id=user.id)
+        storage.new(place)
+        if STORAGE_TYPE == 'db' and i % 10000 == 0:
+            storage.save()
+    if STORAGE_TYPE == 'db':
+        storage.save()
+    return place.id
+
+
+def time_get(place_id):
+    """returns mean microseconds for storage.get and for the view"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        storage.get('Place', place_id)
+    get_us = (time.perf_counter() - start) / REPEAT * 1e6
+    path = '/api/v1/places/{}'.format(place_id)
+    with app.test_request_context(path):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            places_with_id(place_id)
+        view_us = (time.perf_counter() - start) / REPEAT * 1e6
+    return get_us, view_us
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 10000, 100000]
+    print("{:>10} {:>16} {:>16}".format("places", "get (us)", "view (us)"))
+    for size in sorted(sizes):
+        place_id = grow(size)
+        get_us, view_us = time_get(place_id)
+        print("{:>10} {:>16.2f} {:>16.2f}".format(size, get_us, view_us))
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""
+Benchmark: storage.search_places for a 3 state, 5 amenity query
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/places_search.py [SIZE ...]
+
+SIZE defaults to 10000 100000 (pass 1000000 for the 1M place run).
+Places are spread over 50 states of 20 cities and carry 8 of 20
+amenities each. Uses whichever storage engine HBNB_TYPE_STORAGE selects.
+File storage is only grown in memory; in db mode point the HBNB_MYSQL_*
+variables at a scratch database, rows are inserted for real.
+"""
+import random
+import sys
+import time
+from os import environ
+from models import storage, CNC
+
+REPEAT = 20
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
+rand = random.Random(98)
+
+
+def setup():
+    """creates the states, cities, amenities and user places refer to"""
+    states = [CNC['State'](name="State {}".format(i)) for i in range(50)]
+    cities = [CNC['City'](name="City {}".format(i), state_id=s.id)
+              for s in states for i in range(20)]
+    amenities = [CNC['Amenity'](name="Amenity {}".format(i))
+                 for i in range(20)]
+    user = CNC['User'](email="bench@hbnb.io", password="bench")
+    for obj in states + cities + amenities + [user]:
+        storage.new(obj)
+    if STORAGE_TYPE == 'db':
+        storage.save()
+    return states, cities, amenities, user
+
+
+def grow(target, cities, amenities, user):
+    """adds places until the store holds `target` of them"""
+    for i in range(storage.count('Place'), target):
+        place = CNC['Place'](name="place {}".format(i),
+                             city_id=rand.choice(cities).id,
+                             user_id=user.id)
+        if STORAGE_TYPE == 'db':
+            place.amenities.extend(rand.sample(amenities, 8))
+        else:
+            place.amenity_ids = [a.id for a in rand.sample(amenities, 8)]
+        storage.new(place)
+        if STORAGE_TYPE == 'db' and i % 10000 == 0:
+            storage.save()
+    if STORAGE_TYPE == 'db':
+        storage.save()
+
+
+def time_search(states, amenities):
+    """returns mean milliseconds and result size of the search"""
+    state_ids = [s.id for s in rand.sample(states, 3)]
+    amenity_ids = [a.id for a in rand.sample(amenities, 5)]
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        found = storage.search_places(state_ids, None, amenity_ids)
+    return (time.perf_counter() - start) / REPEAT * 1e3, len(found)
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    sizes = [int(n) for n in sys.argv[1:]] or [10000, 100000]
+    states, cities, amenities, user = setup()
+    print("{:>10} {:>12} {:>16}".format("places", "found", "search (ms)"))
+    for size in sorted(sizes):
+        grow(size, cities, amenities, user)
+        search_ms, found = time_search(states, amenities)
+        print("{:>10} {:>12} {:>16.2f}".format(size, found, search_ms))
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""
+Benchmark: FileStorage.reload() time with the fast timestamp parser versus
+datetime.strptime, on a generated JSON file
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/reload_speed.py [COUNT]
+
+COUNT defaults to 100000 objects (pass 500000 for the large file run).
+Runs inside a temporary directory so ./dev/file.json is left alone.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from models import storage, CNC
+from models.base_model import BaseModel
+
+fast_parse = BaseModel._BaseModel__parse_datetime
+
+
+def strptime_parse(self, value):
+    """the previous parser: strptime with the microseconds format"""
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+
+
+def timed_reload(parser):
+    """reloads the store with the given parser, returns seconds"""
+    BaseModel._BaseModel__parse_datetime = parser
+    start = time.perf_counter()
+    storage.reload()
+    elapsed = time.perf_counter() - start
+    BaseModel._BaseModel__parse_datetime = fast_parse
+    return elapsed
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    os.chdir(tempfile.mkdtemp())
+    os.mkdir('dev')
+    storage.delete_all()
+    for i in range(count):
+        review = CNC['Review'](text="review {}".format(i),
+                               place_id="place-id", user_id="user-id")
+        review.updated_at = review.created_at
+        storage.new(review)
+    storage.save()
+    print("{:>10} {:>14} {:>14}".format("objects", "parser", "reload (s)"))
+    for name, parser in [('strptime', strptime_parse), ('fast', fast_parse)]:
+        print("{:>10} {:>14} {:>14.3f}".format(
+            count, name, timed_reload(parser)))
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""
+Benchmark: GET /api/v1/status latency against FileStorage size, with the
+request teardown reloading the whole store (before) and with the keep warm
+storage.close() (after)
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/status_latency.py [SIZE ...]
+
+SIZE defaults to 100 1000 10000 50000 objects. Runs inside a temporary
+directory so ./dev/file.json is left alone.
+"""
+import os
+import sys
+import tempfile
+import time
+from api.v1.app import app
+from models import storage, CNC
+
+REQUESTS = 50
+
+
+def fill(size):
+    """replaces the store with `size` places and writes the snapshot"""
+    storage.delete_all()
+    for i in range(size):
+        storage.new(CNC['Place'](name="place {}".format(i)))
+    storage.save()
+    storage.reload()
+
+
+def latency(client, full_reload):
+    """mean milliseconds per GET /api/v1/status"""
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get('/api/v1/status')
+        if full_reload:
+            storage.reload()
+    return (time.perf_counter() - start) / REQUESTS * 1000
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 10000, 50000]
+    os.chdir(tempfile.mkdtemp())
+    os.mkdir('dev')
+    client = app.test_client()
+    print("{:>10} {:>14} {:>14}".format(
+        "objects", "before (ms)", "after (ms)"))
+    for size in sizes:
+        fill(size)
+        before = latency(client, True)
+        after = latency(client, False)
+        print("{:>10} {:>14.3f} {:>14.3f}".format(size, before, after))
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Benchmark: BaseModel.to_json throughput for every model class, compared
+with the previous implementation that probed each value with json.dumps
+
+Usage (from the repository root):
+
+    PYTHONPATH=. ./dev/benchmarks/to_json_throughput.py [COUNT]
+
+COUNT defaults to 10000 objects per class. The script also checks that
+both implementations produce the same JSON text.
+"""
+import json
+import sys
+import time
+from models import CNC
+
+SAMPLE_ATTRS = {
+    'Amenity': {'name': "Wifi"},
+    'BaseModel': {'name': "model", 'number': 89},
+    'City': {'name': "Austin", 'state_id': "state-id"},
+    'Place': {'name': "Loft", 'city_id': "city-id", 'user_id': "user-id",
+              'description': "Nice loft", 'number_rooms': 2,
+              'number_bathrooms': 1, 'max_guest': 4, 'price_by_night': 120,
+              'latitude': 30.26, 'longitude': -97.74,
+              'amenity_ids': ["amenity-1", "amenity-2"]},
+    'Review': {'text': "Great stay", 'place_id': "place-id",
+               'user_id': "user-id"},
+    'State': {'name': "Texas"},
+    'User': {'email': "bench@hbnb.io", 'password': "pwd",
+             'first_name': "Betty", 'last_name': "Holberton"},
+}
+
+
+def legacy_to_json(obj, saving_file_storage=False):
+    """to_json as it was, probing every value with json.dumps"""
+    def is_serializable(obj_v):
+        try:
+            obj_to_str = json.dumps(obj_v)
+            return obj_to_str is not None and isinstance(obj_to_str, str)
+        except (TypeError, ValueError):
+            return False
+    obj_class = obj.__class__.__name__
+    bm_dict = {k: v if is_serializable(v) else str(v)
+               for k, v in obj.__dict__.items()}
+    bm_dict.pop('_sa_instance_state', None)
+    bm_dict.pop('_BaseModel__dirty', None)
+    bm_dict.update({'__class__': obj_class})
+    if not saving_file_storage and obj_class == 'User':
+        bm_dict.pop('password', None)
+    return bm_dict
+
+
+def objects_per_second(func, objs):
+    """calls func on every object, returns objects per second"""
+    start = time.perf_counter()
+    for obj in objs:
+        func(obj)
+    return len(objs) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    """
+    MAIN Benchmark
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print("{:>10} {:>14} {:>14} {:>8}".format(
+        "class", "legacy obj/s", "to_json obj/s", "speedup"))
+    for name in sorted(CNC):
+        objs = [CNC[name](**dict(SAMPLE_ATTRS[name])) for _ in range(count)]
+        for obj in objs[:100]:
+            assert (json.dumps(obj.to_json()) ==
+                    json.dumps(legacy_to_json(obj)))
+        legacy = objects_per_second(legacy_to_json, objs)
+        current = objects_per_second(lambda o: o.to_json(), objs)
+        print("{:>10} {:>14.0f} {:>14.0f} {:>7.1f}x".format(
+            name, legacy, current, current / legacy))
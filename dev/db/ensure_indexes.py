@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""
+Migration: adds the indexes the models declare to an existing database
+
+Usage (from the repository root, with the HBNB_MYSQL_* or HBNB_DB_URL
+variables of the database to migrate):
+
+    HBNB_TYPE_STORAGE=db PYTHONPATH=. ./dev/db/ensure_indexes.py
+
+Tables created by this version already have the indexes. Indexes whose
+columns lead an index already there (MySQL adds one per foreign key) are
+not created again, so the script can be run any number of times.
+"""
+from os import environ
+from models import storage
+
+if __name__ == "__main__":
+    if environ.get('HBNB_TYPE_STORAGE') != 'db':
+        raise SystemExit('HBNB_TYPE_STORAGE must be db')
+    created = storage.ensure_indexes()
+    for name in created:
+        print('created {}'.format(name))
+    print('{} index(es) created'.format(len(created)))
@@ -36,6 +36,13 @@ class BaseModel:
         created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
         updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
+    # Types json.dumps always accepts, passed through to_json as they are
+    __JSON_TYPES = (str, int, float, bool, type(None))
+    # Instance attributes that are not part of the serialized object
+    __NOT_SERIALIZED = ('_sa_instance_state', '_BaseModel__dirty')
+    # Callables run as hook(instance, deleted) after save() and delete()
+    CHANGE_HOOKS = []
+
     def __init__(self, *args, **kwargs):
         """
         Initialize a new instance of BaseModel.
@@ -46,6 +53,29 @@ class BaseModel:
             self.id = str(uuid4())
             self.created_at = datetime.utcnow()
 
+    def __setattr__(self, name, value):
+        """
+        Set an attribute, flagging the instance as dirty when the value
+        changes so storage knows it must be written again.
+        """
+        if self.__dict__.get(name, BaseModel) != value:
+            if STORAGE_TYPE != 'db' and not self.is_dirty():
+                models.storage.mark_dirty(self)
+            self.__dict__['_BaseModel__dirty'] = True
+        super().__setattr__(name, value)
+
+    def is_dirty(self):
+        """
+        Return True if the instance changed since it was last flushed.
+        """
+        return self.__dict__.get('_BaseModel__dirty', False)
+
+    def mark_clean(self):
+        """
+        Flag the instance as flushed to storage.
+        """
+        self.__dict__['_BaseModel__dirty'] = False
+
     def __set_attributes(self, attr_dict):
         """
         Set attributes from a dictionary of values.
@@ -56,20 +86,41 @@ class BaseModel:
         if 'created_at' not in attr_dict:
             attr_dict['created_at'] = datetime.utcnow()
         elif not isinstance(attr_dict['created_at'], datetime):
-            attr_dict['created_at'] = datetime.strptime(
-                attr_dict['created_at'], "%Y-%m-%d %H:%M:%S.%f"
-            )
+            attr_dict['created_at'] = self.__parse_datetime(
+                attr_dict['created_at'])
         if 'updated_at' not in attr_dict:
             attr_dict['updated_at'] = datetime.utcnow()
         elif not isinstance(attr_dict['updated_at'], datetime):
-            attr_dict['updated_at'] = datetime.strptime(
-                attr_dict['updated_at'], "%Y-%m-%d %H:%M:%S.%f"
-            )
+            attr_dict['updated_at'] = self.__parse_datetime(
+                attr_dict['updated_at'])
         if STORAGE_TYPE != 'db':
             attr_dict.pop('__class__', None)
         for attr, val in attr_dict.items():
             setattr(self, attr, val)
 
+    def __parse_datetime(self, value):
+        """
+        Parse a stored timestamp, "%Y-%m-%d %H:%M:%S.%f" as written by
+        str(datetime), or "%Y-%m-%d %H:%M:%S" for values without
+        microseconds. The fixed layout, digits only between the
+        separators, is sliced directly, anything else goes through
+        strptime.
+        """
+        size = len(value)
+        if ((size == 19 or size == 26 and value[19] == '.') and
+                value[4] == value[7] == '-' and value[10] == ' ' and
+                value[13] == value[16] == ':' and
+                (value[0:4] + value[5:7] + value[8:10] + value[11:13] +
+                 value[14:16] + value[17:19] + value[20:26]).isdigit()):
+            return datetime(int(value[0:4]), int(value[5:7]),
+                            int(value[8:10]), int(value[11:13]),
+                            int(value[14:16]), int(value[17:19]),
+                            int(value[20:26] or 0))
+        try:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+        except ValueError:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
     def __is_serializable(self, obj_v):
         """
         Check if an object is serializable to JSON.
@@ -95,7 +146,8 @@ class BaseModel:
             }
             for key, value in updated_dict.items():
                 setattr(self, key, value)
-            self.save()
+            if self.is_dirty():
+                self.save()
 
     def save(self):
         """
@@ -104,17 +156,34 @@ class BaseModel:
         self.updated_at = datetime.utcnow()
         models.storage.new(self)
         models.storage.save()
+        self.changed()
+
+    def changed(self, deleted=False):
+        """
+        Run the change hooks for the instance once its change is saved:
+        now, or when the current storage transaction commits.
+        """
+        def run_hooks():
+            """calls every change hook"""
+            for hook in BaseModel.CHANGE_HOOKS:
+                hook(self, deleted)
+        models.storage.after_commit(run_hooks)
 
     def to_json(self, saving_file_storage=False):
         """
         Return a JSON representation of the instance.
         """
         obj_class = self.__class__.__name__
-        bm_dict = {
-            k: v if self.__is_serializable(v) else str(v)
-            for k, v in self.__dict__.items()
-        }
-        bm_dict.pop('_sa_instance_state', None)
+        json_types = BaseModel.__JSON_TYPES
+        bm_dict = {}
+        for k, v in self.__dict__.items():
+            if type(v) in json_types:
+                bm_dict[k] = v
+            elif isinstance(v, datetime):
+                bm_dict[k] = str(v)
+            elif k not in BaseModel.__NOT_SERIALIZED:
+                bm_dict[k] = v if self.__is_serializable(v) else str(v)
+        bm_dict.pop('_BaseModel__dirty', None)
         bm_dict.update({'__class__': obj_class})
         if not saving_file_storage and obj_class == 'User':
             bm_dict.pop('password', None)
@@ -125,10 +194,14 @@ class BaseModel:
         Return a string representation of the instance.
         """
         class_name = type(self).__name__
-        return '[{}] ({}) {}'.format(class_name, self.id, self.__dict__)
+        attrs = {k: v for k, v in self.__dict__.items()
+                 if k != '_BaseModel__dirty'}
+        return '[{}] ({}) {}'.format(class_name, self.id, attrs)
 
     def delete(self):
         """
         Delete the current instance from storage.
         """
+        self.__dict__['_BaseModel__dirty'] = True
         models.storage.delete(self)
+        self.changed(True)
@@ -21,7 +21,8 @@ class City(BaseModel, Base):
         # Define table name and columns for database storage
         __tablename__ = 'cities'
         name = Column(String(128), nullable=False)
-        state_id = Column(String(60), ForeignKey('states.id'), nullable=False)
+        state_id = Column(String(60), ForeignKey('states.id'), nullable=False,
+                          index=True)
 
         # Define relationship to Place with cascading delete
         places = relationship('Place', backref='cities', cascade='delete')
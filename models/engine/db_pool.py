@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+"""
+Connection pool settings and metrics for DBStorage
+
+The pool is configured with these environment variables:
+    HBNB_DB_POOL_SIZE      connections kept open (default 5)
+    HBNB_DB_MAX_OVERFLOW   extra connections opened under load (default 10)
+    HBNB_DB_POOL_TIMEOUT   seconds to wait for a free connection (default 30)
+    HBNB_DB_POOL_RECYCLE   seconds before a connection is replaced, keep it
+                           below MySQL's wait_timeout (default 3600)
+    HBNB_DB_POOL_PRE_PING  1 to test connections on checkout, 0 to not
+                           (default 1)
+
+Each gunicorn worker process has its own pool, so the server may open up to
+workers * (HBNB_DB_POOL_SIZE + HBNB_DB_MAX_OVERFLOW) connections: keep that
+below MySQL's max_connections. A sync worker serves one request at a time
+and needs a single connection; threaded workers need one per thread.
+"""
+import os
+import threading
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+        counters of a connection pool, shared by the pools an engine
+        recreates
+    """
+
+    def __init__(self):
+        """
+            creates the counters
+        """
+        self.__lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.connects = 0
+        self.invalidations = 0
+
+    def checkout(self, waited):
+        """
+            counts a checkout that waited seconds for its connection
+        """
+        with self.__lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def timeout(self):
+        """
+            counts a checkout given up after the pool timeout
+        """
+        with self.__lock:
+            self.timeouts += 1
+
+    def connect(self, dbapi_connection, connection_record):
+        """
+            pool connect listener: counts the connections opened
+        """
+        with self.__lock:
+            self.connects += 1
+
+    def invalidate(self, dbapi_connection, connection_record, exception):
+        """
+            pool invalidate listener: counts the connections found broken
+            or stale
+        """
+        with self.__lock:
+            self.invalidations += 1
+
+    def stats(self):
+        """
+            returns the counters
+        """
+        with self.__lock:
+            checkouts = self.checkouts
+            return {
+                'checkouts': checkouts,
+                'timeouts': self.timeouts,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'wait_avg': self.wait_total / checkouts if checkouts else 0,
+                'wait_max': self.wait_max
+            }
+
+
+class MeteredPool(QueuePool):
+    """
+        QueuePool counting checkouts and the time spent waiting for them
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+            creates the pool, a recreated pool keeps the listeners and so
+            the metrics of the pool it replaces
+        """
+        QueuePool.__init__(self, *args, **kwargs)
+        self.metrics = PoolMetrics()
+        if kwargs.get('_dispatch') is None:
+            event.listen(self, 'connect', self.metrics.connect)
+            event.listen(self, 'invalidate', self.metrics.invalidate)
+
+    def recreate(self):
+        """
+            returns a new pool with the settings and metrics of this one
+        """
+        new_pool = QueuePool.recreate(self)
+        new_pool.metrics = self.metrics
+        return new_pool
+
+    def _do_get(self):
+        """
+            checks a connection out of the pool, timing the wait
+        """
+        start = time.time()
+        try:
+            conn = QueuePool._do_get(self)
+        except exc.TimeoutError:
+            self.metrics.timeout()
+            raise
+        self.metrics.checkout(time.time() - start)
+        return conn
+
+    def stats(self):
+        """
+            returns the pool settings, state and metrics
+        """
+        stats = self.metrics.stats()
+        stats.update({
+            'size': self.size(),
+            'max_overflow': self._max_overflow,
+            'checked_out': self.checkedout(),
+            'overflow': max(self.overflow(), 0)
+        })
+        return stats
+
+
+def pool_options(url):
+    """
+        returns the create_engine keyword arguments of the pool for url,
+        none for in-memory SQLite, which needs a single connection
+    """
+    env = os.environ.get
+    url = make_url(url)
+    if url.drivername.startswith('sqlite') and url.database in (
+            None, '', ':memory:'):
+        return {}
+    return {
+        'poolclass': MeteredPool,
+        'pool_size': int(env('HBNB_DB_POOL_SIZE') or 5),
+        'max_overflow': int(env('HBNB_DB_MAX_OVERFLOW') or 10),
+        'pool_timeout': float(env('HBNB_DB_POOL_TIMEOUT') or 30),
+        'pool_recycle': int(env('HBNB_DB_POOL_RECYCLE') or 3600),
+        'pool_pre_ping': env('HBNB_DB_POOL_PRE_PING', '1') != '0'
+    }
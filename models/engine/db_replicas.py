@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+"""
+Read replica routing for DBStorage
+
+DBStorage sends reads to the databases named by HBNB_DB_REPLICA_URLS, a
+comma separated list of URLs, taking the healthy replicas in turn. Writes,
+and every query of a session once it has written or entered a storage
+transaction, go to the primary: a request reads its own writes, and the
+next request (a new session) reads from the replicas again. Replicas may
+lag behind the primary, so other requests can briefly read older data.
+
+A replica is checked with SELECT 1 when it was last checked more than
+HBNB_DB_REPLICA_CHECK seconds ago (default 5), and marked down at once when
+a query on it loses its connection. Reads go to the primary while no
+replica is healthy.
+"""
+import os
+import threading
+import time
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import UpdateBase
+from models.engine.db_pool import pool_options
+
+
+class Replica:
+    """
+        engine and health of one read replica
+    """
+
+    def __init__(self, url):
+        """
+            creates the engine of the replica at url
+        """
+        self.engine = create_engine(url, **pool_options(url))
+        self.name = repr(self.engine.url)
+        self.healthy = True
+        self.checked = 0
+        self.reads = 0
+        self.failures = 0
+        event.listen(self.engine, 'handle_error', self.__on_error)
+
+    def is_healthy(self, interval):
+        """
+            returns True if the replica answers, checking it again if it
+            was last checked more than interval seconds ago
+        """
+        now = time.time()
+        if now - self.checked >= interval:
+            self.checked = now
+            try:
+                with self.engine.connect() as conn:
+                    conn.execute(text('SELECT 1'))
+                self.healthy = True
+            except exc.DBAPIError:
+                self.healthy = False
+                self.failures += 1
+        return self.healthy
+
+    def __on_error(self, context):
+        """
+            private: marks the replica down when it loses a connection
+        """
+        if context.is_disconnect:
+            self.healthy = False
+            self.checked = time.time()
+            self.failures += 1
+
+
+class ReplicaSet:
+    """
+        read replicas taken in turn, skipping the unhealthy ones
+    """
+
+    def __init__(self, urls, interval=None):
+        """
+            creates the replicas at urls, checked every interval seconds
+        """
+        if interval is None:
+            interval = float(os.environ.get('HBNB_DB_REPLICA_CHECK') or 5)
+        self.interval = interval
+        self.replicas = [Replica(url) for url in urls]
+        self.primary_reads = 0
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    def pick(self):
+        """
+            returns the engine of the next healthy replica, None if no
+            replica is healthy
+        """
+        with self.__lock:
+            start = self.__next
+            self.__next = (start + 1) % len(self.replicas)
+        for i in range(len(self.replicas)):
+            replica = self.replicas[(start + i) % len(self.replicas)]
+            if replica.is_healthy(self.interval):
+                with self.__lock:
+                    replica.reads += 1
+                return replica.engine
+        with self.__lock:
+            self.primary_reads += 1
+        return None
+
+    def stats(self):
+        """
+            returns the health and reads of each replica
+        """
+        return {
+            'primary_reads': self.primary_reads,
+            'replicas': [{
+                'url': replica.name,
+                'healthy': replica.healthy,
+                'reads': replica.reads,
+                'failures': replica.failures,
+                'pool': replica.engine.pool.stats()
+                if hasattr(replica.engine.pool, 'stats') else None
+            } for replica in self.replicas]
+        }
+
+    def dispose(self):
+        """
+            closes the connections of every replica
+        """
+        for replica in self.replicas:
+            replica.engine.dispose()
+
+
+class RoutingSession(Session):
+    """
+        Session reading from the replicas until it writes
+    """
+
+    def __init__(self, replicas=None, **kwargs):
+        """
+            creates a session reading from the replicas ReplicaSet, from
+            its bind only if replicas is None
+        """
+        Session.__init__(self, **kwargs)
+        self.replicas = replicas
+
+    def use_primary(self):
+        """
+            sends the next queries of the session to the primary
+        """
+        self.info['primary'] = True
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """
+            returns the engine of a replica for reads, the primary for
+            writes and once the session has written
+        """
+        if self.replicas is not None and not self.info.get('primary'):
+            if self._flushing or isinstance(clause, UpdateBase):
+                self.use_primary()
+            else:
+                engine = self.replicas.pick()
+                if engine is not None:
+                    return engine
+        return Session.get_bind(self, mapper, clause=clause, **kwargs)
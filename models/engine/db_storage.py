@@ -4,9 +4,14 @@ Database engine
 """
 
 import os
-from sqlalchemy import create_engine, MetaData
-from sqlalchemy.orm import sessionmaker, scoped_session
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, func, inspect, and_, or_, MetaData
+from sqlalchemy.orm import Load, sessionmaker, scoped_session
 from models.base_model import Base
+from models.engine.db_pool import pool_options
+from models.engine.db_replicas import ReplicaSet, RoutingSession
 from models import base_model, amenity, city, place, review, state, user
 
 
@@ -28,27 +33,50 @@ class DBStorage:
     """
     __engine = None
     __session = None
+    __count_ttl = 0
+    __counts = {}
+    """__counts - optional in-process cache of count() results:
+    { Class Name : (count, expiry time) }, kept for HBNB_COUNT_CACHE seconds
+    """
+    BULK_CHUNK = int(os.environ.get('HBNB_DB_BULK_CHUNK') or 1000)
+    """BULK_CHUNK - most rows bulk_save() inserts with one statement"""
 
-    def __init__(self):
+    def __init__(self, replica_urls=None):
         """
-            creates the engine self.__engine
+            creates the engine self.__engine on the HBNB_DB_URL database
+            if set, else on the HBNB_MYSQL_* MySQL database, with the pool
+            configured by the HBNB_DB_POOL_* variables (see db_pool);
+            reads go to the replica_urls databases, HBNB_DB_REPLICA_URLS
+            if None (see db_replicas)
         """
-        self.__engine = create_engine(
+        self.__count_ttl = float(os.environ.get('HBNB_COUNT_CACHE') or 0)
+        self.__counts = {}
+        self.__tx = threading.local()
+        url = os.environ.get('HBNB_DB_URL') or \
             'mysql+mysqldb://{}:{}@{}/{}'.format(
                 os.environ.get('HBNB_MYSQL_USER'),
                 os.environ.get('HBNB_MYSQL_PWD'),
                 os.environ.get('HBNB_MYSQL_HOST'),
-                os.environ.get('HBNB_MYSQL_DB')))
+                os.environ.get('HBNB_MYSQL_DB'))
+        self.__engine = create_engine(url, **pool_options(url))
+        if replica_urls is None:
+            replica_urls = [
+                r_url.strip() for r_url in
+                (os.environ.get('HBNB_DB_REPLICA_URLS') or '').split(',')
+                if r_url.strip()]
+        self.__replicas = ReplicaSet(replica_urls) if replica_urls else None
         if os.environ.get("HBNB_ENV") == 'test':
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
+    def all(self, cls=None, with_related=None):
         """
-           returns a dictionary of all objects
+           returns a dictionary of all objects; with_related names the
+           relationships of cls to load with them (see load_options)
         """
         obj_dict = {}
         if cls is not None:
-            a_query = self.__session.query(DBStorage.CNC[cls])
+            a_query = self.__session.query(DBStorage.CNC[cls]).options(
+                *self.load_options(cls, with_related))
             for obj in a_query:
                 obj_ref = "{}.{}".format(type(obj).__name__, obj.id)
                 obj_dict[obj_ref] = obj
@@ -61,22 +89,119 @@ class DBStorage:
                 obj_dict[obj_ref] = obj
         return obj_dict
 
+    def iter(self, cls=None, batch_size=1000):
+        """
+            yields the stored objects, only those of class name cls if
+            given, fetching batch_size rows at a time from a server side
+            cursor so only the current batch is kept in memory
+        """
+        if cls is not None:
+            classes = [DBStorage.CNC[cls]]
+        else:
+            classes = DBStorage.CNC.values()
+        for c in classes:
+            for obj in self.__session.query(c).yield_per(batch_size):
+                yield obj
+
     def new(self, obj):
         """
             adds objects to current database session
         """
+        self.__counts.clear()
         self.__session.add(obj)
 
+    def bulk_new(self, objects):
+        """
+            queues objects to be inserted by the next bulk_save()
+        """
+        self.__session().info.setdefault('bulk', []).extend(objects)
+
+    def bulk_save(self):
+        """
+            inserts the objects queued by bulk_new(), parents first, with
+            one executemany INSERT per class and BULK_CHUNK objects, then
+            commits like save(); the objects are not added to the session
+            and their relationships (e.g. Place.amenities) are not saved
+        """
+        objects = self.__session().info.pop('bulk', [])
+        order = {table.name: i
+                 for i, table in enumerate(Base.metadata.sorted_tables)}
+        objects.sort(key=lambda obj: order[obj.__tablename__])
+        chunk = DBStorage.BULK_CHUNK
+        try:
+            for i in range(0, len(objects), chunk):
+                self.__session.bulk_save_objects(objects[i:i + chunk])
+        except Exception:
+            self.rollback_session()
+            raise
+        self.__counts.clear()
+        self.save()
+        for obj in objects:
+            obj.changed()
+
     def save(self):
         """
-            commits all changes of current database session
+            commits all changes of current database session; deferred to
+            the end of the transaction inside transaction()
         """
+        if getattr(self.__tx, 'depth', 0):
+            return
         self.__session.commit()
 
+    @contextmanager
+    def transaction(self):
+        """
+            defers save() until the outermost transaction block of this
+            thread exits, then commits once; rolls the session back if
+            the block raises or the commit fails
+        """
+        tx = self.__tx
+        tx.depth = getattr(tx, 'depth', 0) + 1
+        if tx.depth == 1:
+            tx.after_commit = []
+            self.__session().use_primary()
+        try:
+            yield self
+        except Exception:
+            tx.depth -= 1
+            if not tx.depth:
+                self.__rollback_tx()
+            raise
+        tx.depth -= 1
+        if tx.depth:
+            return
+        try:
+            self.save()
+        except Exception:
+            self.__rollback_tx()
+            raise
+        callbacks = tx.after_commit
+        tx.after_commit = []
+        for callback in callbacks:
+            callback()
+
+    def __rollback_tx(self):
+        """
+            private: drops the transaction's callbacks and changes
+        """
+        self.__tx.after_commit = []
+        self.rollback_session()
+
+    def after_commit(self, callback):
+        """
+            calls callback now, or once the current transaction commits
+        """
+        if getattr(self.__tx, 'depth', 0):
+            self.__tx.after_commit.append(callback)
+        else:
+            callback()
+
     def rollback_session(self):
         """
             rollsback a session in the event of an exception
         """
+        self.__counts.clear()
+        self.__session().info.pop('bulk', None)
         self.__session.rollback()
 
     def delete(self, obj=None):
@@ -84,6 +209,7 @@ class DBStorage:
             deletes obj from current database session if not None
         """
         if obj:
+            self.__counts.clear()
             self.__session.delete(obj)
             self.save()
 
@@ -107,7 +233,47 @@ class DBStorage:
         self.__session = scoped_session(
             sessionmaker(
                 bind=self.__engine,
-                expire_on_commit=False))
+                expire_on_commit=False,
+                class_=RoutingSession,
+                replicas=self.__replicas))
+
+    def ensure_indexes(self):
+        """
+            creates the indexes declared by the models that the tables of
+            an existing database lack, skipping those whose columns lead
+            an index already there; returns the names of the created
+            indexes, none when run again
+        """
+        inspector = inspect(self.__engine)
+        tables = inspector.get_table_names()
+        created = []
+        for table in Base.metadata.sorted_tables:
+            if table.name not in tables:
+                continue
+            existing = [tuple(index['column_names'])
+                        for index in inspector.get_indexes(table.name)]
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                columns = tuple(column.name for column in index.columns)
+                if any(e[:len(columns)] == columns for e in existing):
+                    continue
+                index.create(self.__engine)
+                existing.append(columns)
+                created.append(index.name)
+        return created
+
+    def pool_stats(self):
+        """
+            returns the settings, state and metrics of the connection
+            pool, and the health of the read replicas, None if the engine
+            does not use a metered pool
+        """
+        stats = getattr(self.__engine.pool, 'stats', None)
+        if stats is None:
+            return None
+        stats = stats()
+        if self.__replicas is not None:
+            stats['replicas'] = self.__replicas.stats()
+        return stats
 
     def close(self):
         """
@@ -115,18 +281,155 @@ class DBStorage:
         """
         self.__session.remove()
 
-    def get(self, cls, id):
+    def get(self, cls, id, with_related=None):
         """
-            retrieves one object based on class name and id
+            retrieves one object based on class name and id; with_related
+            names the relationships to load with it (see load_options)
         """
         if cls and id:
-            fetch = "{}.{}".format(cls, id)
-            all_obj = self.all(cls)
-            return all_obj.get(fetch)
+            a_query = self.__session.query(DBStorage.CNC[cls]).options(
+                *self.load_options(cls, with_related))
+            return a_query.get(id)
         return None
 
+    def load_options(self, cls, with_related=None):
+        """
+            returns the query options eagerly loading the relationships
+            of class name cls named in with_related, 'cities.places'
+            style paths load relationships of the related objects too:
+            collections are loaded with one SELECT ... IN query per
+            relationship, single objects with a JOIN
+        """
+        options = []
+        for a_path in with_related or ():
+            model = DBStorage.CNC[cls]
+            option = Load(model)
+            for name in a_path.split('.'):
+                attr = getattr(model, name)
+                if attr.property.uselist:
+                    option = option.selectinload(attr)
+                else:
+                    option = option.joinedload(attr)
+                model = attr.property.mapper.class_
+            options.append(option)
+        return options
+
+    def by_fk(self, cls, attr, value):
+        """
+            returns a dictionary of the cls objects whose foreign key
+            attribute attr equals value
+        """
+        fk_class = DBStorage.CNC[cls]
+        a_query = self.__session.query(fk_class).filter(
+            getattr(fk_class, attr) == value)
+        return {'{}.{}'.format(cls, obj.id): obj for obj in a_query}
+
+    def generation(self, cls, attr=None, value=None):
+        """
+            returns (count, latest updated_at) of the cls objects, only
+            those with attribute attr equal to value if attr is given
+        """
+        model = DBStorage.CNC[cls]
+        a_query = self.__session.query(func.count(model.id),
+                                       func.max(model.updated_at))
+        if attr is not None:
+            a_query = a_query.filter(getattr(model, attr) == value)
+        count, latest = a_query.one()
+        return count, latest
+
+    def page(self, cls, limit, after=None, attr=None, value=None):
+        """
+            returns up to limit cls objects (with attribute attr equal to
+            value if given) ordered by (created_at, id), starting after
+            the (created_at, id) tuple after
+        """
+        model = DBStorage.CNC[cls]
+        a_query = self.__session.query(model)
+        if attr is not None:
+            a_query = a_query.filter(getattr(model, attr) == value)
+        return self.__first(a_query, model, limit, after)
+
+    def __first(self, a_query, model, limit, after=None):
+        """
+            private: limits a_query to its first limit rows, ordered by
+            (created_at, id), that come after the (created_at, id) tuple
+        """
+        if after is not None:
+            created_at, obj_id = after
+            a_query = a_query.filter(or_(
+                model.created_at > created_at,
+                and_(model.created_at == created_at, model.id > obj_id)))
+        return a_query.order_by(model.created_at, model.id).limit(
+            limit).all()
+
+    def search_places(self, states=None, cities=None, amenities=None,
+                      limit=None, after=None):
+        """
+            returns the Places in the given cities or in the cities of
+            the given states (all Places if none) that have every given
+            amenity, ordered by (created_at, id), only the limit first
+            after the (created_at, id) tuple after if limit is given
+        """
+        Place = DBStorage.CNC['Place']
+        City = DBStorage.CNC['City']
+        Amenity = DBStorage.CNC['Amenity']
+        PlaceAmenity = place.PlaceAmenity
+        query = self.__session.query
+        a_query = query(Place)
+        city_filters = []
+        if states:
+            city_filters.append(City.state_id.in_(set(states)))
+        if cities:
+            city_filters.append(City.id.in_(set(cities)))
+        if city_filters:
+            city_ids = query(City.id).filter(or_(*city_filters))
+            a_query = a_query.filter(or_(~city_ids.exists(),
+                                         Place.city_id.in_(city_ids)))
+        if amenities:
+            amenity_ids = set(amenities)
+            found = query(func.count(Amenity.id)).filter(
+                Amenity.id.in_(amenity_ids)).label('found')
+            with_all = query(PlaceAmenity.place_id).filter(
+                PlaceAmenity.amenity_id.in_(amenity_ids)).group_by(
+                PlaceAmenity.place_id).having(
+                func.count(PlaceAmenity.amenity_id) == found)
+            a_query = a_query.filter(
+                Place.id.in_(query(PlaceAmenity.place_id)),
+                or_(found == 0, Place.id.in_(with_all)))
+        if limit is not None:
+            return self.__first(a_query, Place, limit, after)
+        return a_query.order_by(Place.created_at, Place.id).all()
+
     def count(self, cls=None):
         """
             returns the count of all objects in storage
         """
-        return (len(self.all(cls)))
+        if cls is not None:
+            return self.count_by_class([cls])[cls]
+        return sum(self.count_by_class().values())
+
+    def count_by_class(self, classes=None):
+        """
+            returns { Class Name : count } for the given class names,
+            all classes if None, using one aggregate COUNT query
+        """
+        if classes is None:
+            classes = DBStorage.CNC.keys()
+        now = time.time()
+        counts = {}
+        for cls in classes:
+            cached = self.__counts.get(cls)
+            if cached and cached[1] > now:
+                counts[cls] = cached[0]
+        missing = [cls for cls in classes if cls not in counts]
+        if missing:
+            subqueries = [
+                self.__session.query(
+                    func.count(DBStorage.CNC[cls].id)).label(cls)
+                for cls in missing]
+            row = self.__session.query(*subqueries).one()
+            for cls, cls_count in zip(missing, row):
+                counts[cls] = cls_count
+                if self.__count_ttl > 0:
+                    self.__counts[cls] = (cls_count, now + self.__count_ttl)
+        return counts
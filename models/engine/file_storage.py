@@ -2,14 +2,41 @@
 """
 Handles I/O, writing and reading, of JSON for storage of all class instances
 """
+import bisect
+import heapq
 import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from uuid import uuid4
 from models import base_model, amenity, city, place, review, state, user
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 strptime = datetime.strptime
 to_json = base_model.BaseModel.to_json
 
 
+def fsync_policy(policy):
+    """
+        returns policy if it is a valid FSYNC policy: 'always', 'never' or
+        a number of milliseconds; raises ValueError otherwise
+    """
+    if policy not in ('always', 'never'):
+        try:
+            float(policy)
+        except ValueError:
+            raise ValueError("HBNB_FILE_FSYNC must be 'always', 'never' or "
+                             "a number of milliseconds, not {!r}".format(
+                                 policy))
+    return policy
+
+
 class FileStorage:
     """
         handles long term storage of all class instances
@@ -27,54 +54,684 @@ class FileStorage:
     keys: Class Names
     values: Class type (used for instantiation)
     """
+    FK = {
+        'City': ('state_id',),
+        'Place': ('city_id', 'user_id', 'amenity_ids'),
+        'Review': ('place_id', 'user_id')
+    }
+    """FK - foreign key attributes indexed for by_fk(), per Class Name,
+    list attributes are indexed under each of their values; only string
+    values are indexed, others reference no object
+    """
+    JOURNAL = (os.environ.get('HBNB_FILE_JOURNAL') or '0') != '0'
+    JOURNAL_MAX = int(os.environ.get('HBNB_FILE_JOURNAL_MAX') or 8388608)
+    """JOURNAL - HBNB_FILE_JOURNAL=1 to enable, 0 or unset to disable (the
+    default); if True, save() appends changed objects to __journal_path
+    instead of rewriting __file_path, the journal is folded back into a new
+    snapshot once it grows past JOURNAL_MAX bytes
+    """
+    FSYNC = fsync_policy(os.environ.get('HBNB_FILE_FSYNC') or 'never')
+    """FSYNC - durability policy of writes: 'always' fsyncs on every save,
+    'never' leaves flushing to the OS, a number N fsyncs a journal append
+    when the last fsync is more than N milliseconds old; snapshots are
+    fsynced, with their directory, under every policy but 'never'
+    """
+    RELOAD_HOOKS = []
+    """RELOAD_HOOKS - callables run without arguments once refresh() or
+    save() loaded objects that another process wrote
+    """
     __file_path = './dev/file.json'
+    __journal_path = './dev/file.json.log'
+    __lock_path = './dev/file.json.lock'
     __objects = {}
+    __class_objects = {}
+    """__class_objects - __objects partitioned by class name:
+    { Class Name : { <obj class name>.id : obj } }
+    """
+    __fk_index = {}
+    __fk_values = {}
+    """__fk_index - objects by foreign key value:
+    { (Class Name, attribute) : { value : { <obj class name>.id : obj } } }
+    __fk_values - the values each object is indexed under:
+    { <obj class name>.id : ((Class Name, attribute), value), ... }
+    """
+    __sorted = {}
+    """__sorted - per class index for page(), built on first use and then
+    kept in step with __register/__unregister:
+    { Class Name : [ (created_at, id), ... ] } in ascending order
+    """
+    __generation = {}
+    __epoch = uuid4().hex
+    """__generation - per class counter bumped by __register/__unregister,
+    __epoch - token renewed whenever __objects is replaced; together they
+    name a version of a class's objects without scanning them
+    """
+    __changed = set()
+    __deleted = set()
+    """__changed, __deleted - keys added, changed or removed since the last
+    save()"""
+    __serialized = {}
+    """__serialized - JSON text of every object as last written, reused
+    for objects that are not dirty: { <obj class name>.id : JSON string }
+    """
+    __last_fsync = 0
+    __thread_lock = threading.RLock()
+    __local = threading.local()
+    """__thread_lock, __local - threads of this process take __thread_lock
+    before the flock, __local.lock_depth counts a thread's nested __lock()
+    """
+    __tx = threading.local()
+    """__tx - per thread depth of nested transaction() blocks, and the
+    after_commit callbacks to run once the outermost one is saved
+    """
+    __bulk = []
+    """__bulk - objects of bulk_new() whose change hooks bulk_save() runs"""
+    __disk_sig = None
+    __in_sync = False
+    """__disk_sig - signature of the files when this process last read or
+    wrote them, compared to detect writes by other processes;
+    __in_sync - True while __objects holds what the files held at
+    __disk_sig, which then names the objects in every process
+    """
 
-    def all(self, cls=None):
+    def all(self, cls=None, with_related=None):
         """
-            returns private attribute: __objects
+            returns private attribute: __objects; with_related is
+            accepted for DBStorage compatibility, related objects are
+            already in memory
         """
         if cls is not None:
-            new_objs = {}
-            for clsid, obj in FileStorage.__objects.items():
-                if type(obj).__name__ == cls:
-                    new_objs[clsid] = obj
-            return new_objs
+            return dict(FileStorage.__class_objects.get(cls, {}))
         else:
             return FileStorage.__objects
 
+    def iter(self, cls=None, batch_size=1000):
+        """
+            yields the stored objects, only those of class name cls if
+            given, without copying them into a new dictionary; objects
+            are all in memory already so batch_size is not used
+        """
+        if cls is not None:
+            objs = FileStorage.__class_objects.get(cls, {})
+        else:
+            objs = FileStorage.__objects
+        for bm_id in list(objs):
+            obj = objs.get(bm_id)
+            if obj is not None:
+                yield obj
+
+    def by_fk(self, cls, attr, value):
+        """
+            returns a dictionary of the cls objects whose foreign key
+            attribute attr equals value
+        """
+        if attr in FileStorage.FK.get(cls, ()):
+            if not isinstance(value, str):
+                return {}
+            fk_objs = FileStorage.__fk_index.get((cls, attr), {})
+            return dict(fk_objs.get(value, {}))
+        return {bm_id: obj
+                for bm_id, obj in FileStorage.__class_objects.get(
+                    cls, {}).items()
+                if getattr(obj, attr, None) == value}
+
+    def generation(self, cls, attr=None, value=None):
+        """
+            returns (count, version) of the cls objects, only those with
+            attribute attr equal to value if attr is given; version is an
+            opaque value that changes whenever a cls object is added,
+            updated or removed. While __objects matches the files, it is
+            their signature, the same in every process that loaded them
+        """
+        if attr is None:
+            count = len(FileStorage.__class_objects.get(cls, {}))
+        elif attr in FileStorage.FK.get(cls, ()) and isinstance(value, str):
+            count = len(FileStorage.__fk_index.get((cls, attr), {}).get(
+                value, ()))
+        else:
+            count = len(self.by_fk(cls, attr, value))
+        if (FileStorage.__in_sync and not FileStorage.__changed and
+                not FileStorage.__deleted):
+            return count, FileStorage.__disk_sig
+        return count, (os.getpid(), FileStorage.__epoch,
+                       FileStorage.__generation.get(cls, 0))
+
+    def page(self, cls, limit, after=None, attr=None, value=None):
+        """
+            returns up to limit cls objects (with attribute attr equal to
+            value if given) ordered by (created_at, id), starting after
+            the (created_at, id) tuple after
+        """
+        if attr is not None:
+            objs = self.by_fk(cls, attr, value).values()
+            return self.__first(objs, limit, after)
+        index = FileStorage.__sorted.get(cls)
+        if index is None:
+            index = sorted((obj.created_at, obj.id) for obj in
+                           FileStorage.__class_objects.get(cls, {}).values())
+            FileStorage.__sorted[cls] = index
+        start = 0 if after is None else bisect.bisect_right(index, after)
+        return [FileStorage.__objects['{}.{}'.format(cls, obj_id)]
+                for _, obj_id in index[start:start + limit]]
+
+    def __first(self, objs, limit, after=None):
+        """
+            private: returns the first limit objs, ordered by (created_at,
+            id), that come after the (created_at, id) tuple after
+        """
+        if after is not None:
+            objs = (obj for obj in objs if (obj.created_at, obj.id) > after)
+        return heapq.nsmallest(limit, objs,
+                               key=lambda obj: (obj.created_at, obj.id))
+
+    def search_places(self, states=None, cities=None, amenities=None,
+                      limit=None, after=None):
+        """
+            returns the Places in the given cities or in the cities of
+            the given states (all Places if none) that have every given
+            amenity, ordered by (created_at, id), only the limit first
+            after the (created_at, id) tuple after if limit is given
+        """
+        places = FileStorage.__class_objects.get('Place', {})
+        city_ids = set(c_id for c_id in cities or ()
+                       if self.get('City', c_id))
+        for s_id in set(states or ()):
+            city_ids.update(city.id for city in
+                            self.by_fk('City', 'state_id', s_id).values())
+        candidates = []
+        if city_ids:
+            city_index = FileStorage.__fk_index.get(('Place', 'city_id'), {})
+            city_keys = set()
+            for c_id in city_ids:
+                city_keys.update(city_index.get(c_id, ()))
+            candidates.append(city_keys)
+        if amenities:
+            amenity_index = FileStorage.__fk_index.get(
+                ('Place', 'amenity_ids'), {})
+            candidates.extend(amenity_index.get(a_id, {})
+                              for a_id in set(amenities)
+                              if self.get('Amenity', a_id))
+        if candidates:
+            candidates.sort(key=len)
+            keys = set(candidates[0])
+            for other in candidates[1:]:
+                if not keys:
+                    break
+                keys = set(filter(other.__contains__, keys))
+        else:
+            keys = places.keys()
+        if amenities:
+            keys = [k for k in keys if places[k].amenity_ids]
+        if limit is not None:
+            return self.__first((places[k] for k in keys), limit, after)
+        return sorted((places[k] for k in keys),
+                      key=lambda place: (place.created_at, place.id))
+
+    def bulk_new(self, objects):
+        """
+            sets / updates in __objects each of objects, any iterable,
+            written by the next bulk_save() or save()
+        """
+        objects = list(objects)
+        for obj in objects:
+            self.new(obj)
+        FileStorage.__bulk.extend(objects)
+
+    def bulk_save(self):
+        """
+            saves the objects of bulk_new() with a single save()
+        """
+        objects = FileStorage.__bulk
+        FileStorage.__bulk = []
+        self.save()
+        for obj in objects:
+            obj.changed()
+
     def new(self, obj):
         """
             sets / updates in __objects the obj with key <obj class name>.id
         """
         bm_id = "{}.{}".format(type(obj).__name__, obj.id)
+        with FileStorage.__thread_lock:
+            self.__register(bm_id, obj)
+            FileStorage.__changed.add(bm_id)
+            FileStorage.__deleted.discard(bm_id)
+
+    def mark_dirty(self, obj):
+        """
+            notes that obj changed since it was last saved, if it is the
+            stored object of its key, so the next save() writes it
+        """
+        bm_id = "{}.{}".format(type(obj).__name__, obj.__dict__.get('id'))
+        if FileStorage.__objects.get(bm_id) is obj:
+            FileStorage.__changed.add(bm_id)
+
+    def __register(self, bm_id, obj):
+        """
+            private: adds obj to __objects and to its class partition
+        """
+        cls_name = type(obj).__name__
+        fk_values = set()
+        for attr in FileStorage.FK.get(cls_name, ()):
+            value = getattr(obj, attr, None)
+            values = value if isinstance(value, list) else [value]
+            fk_values.update(((cls_name, attr), v) for v in values
+                             if isinstance(v, str))
+        fk_values = tuple(fk_values)
+        prev = FileStorage.__objects.get(bm_id)
         FileStorage.__objects[bm_id] = obj
+        self.__bump(cls_name)
+        FileStorage.__class_objects.setdefault(cls_name, {})[bm_id] = obj
+        if cls_name in FileStorage.__sorted:
+            if prev is not None:
+                self.__unindex_sorted(cls_name, prev)
+            self.__index_sorted(cls_name, obj)
+        self.__unindex_fk(bm_id)
+        for fk, value in fk_values:
+            fk_objs = FileStorage.__fk_index.setdefault(fk, {})
+            fk_objs.setdefault(value, {})[bm_id] = obj
+        if fk_values:
+            FileStorage.__fk_values[bm_id] = fk_values
+
+    def __unindex_fk(self, bm_id):
+        """
+            private: removes key from the foreign key indexes
+        """
+        for fk, value in FileStorage.__fk_values.pop(bm_id, ()):
+            fk_objs = FileStorage.__fk_index[fk]
+            fk_objs[value].pop(bm_id, None)
+            if not fk_objs[value]:
+                del fk_objs[value]
+
+    def __index_sorted(self, cls_name, obj):
+        """
+            private: inserts obj in the sorted index of its class
+        """
+        index = FileStorage.__sorted.get(cls_name)
+        if index is not None:
+            entry = (obj.created_at, obj.id)
+            if not index or index[-1] < entry:
+                index.append(entry)
+            else:
+                bisect.insort(index, entry)
+
+    def __unindex_sorted(self, cls_name, obj):
+        """
+            private: removes obj from the sorted index of its class, drops
+            the index to be rebuilt if obj is not found in it
+        """
+        index = FileStorage.__sorted.get(cls_name)
+        if index is not None:
+            entry = (obj.created_at, obj.id)
+            i = bisect.bisect_left(index, entry)
+            if i < len(index) and index[i] == entry:
+                del index[i]
+            else:
+                del FileStorage.__sorted[cls_name]
+
+    def __unregister(self, bm_id):
+        """
+            private: removes key from __objects and its class partition,
+            returns the removed object or None
+        """
+        obj = FileStorage.__objects.pop(bm_id, None)
+        FileStorage.__serialized.pop(bm_id, None)
+        self.__unindex_fk(bm_id)
+        if obj is not None:
+            cls_name = type(obj).__name__
+            self.__bump(cls_name)
+            FileStorage.__class_objects.get(cls_name, {}).pop(bm_id, None)
+            self.__unindex_sorted(cls_name, obj)
+        return obj
+
+    def __bump(self, cls_name):
+        """
+            private: moves the generation of class cls_name forward
+        """
+        generation = FileStorage.__generation
+        generation[cls_name] = generation.get(cls_name, 0) + 1
+
+    def __serialize(self, bm_id, bm_obj):
+        """
+            private: returns the JSON text of bm_obj, serializing it only
+            if it changed since it was last written
+        """
+        if bm_obj.is_dirty() or bm_id not in FileStorage.__serialized:
+            FileStorage.__serialized[bm_id] = json.dumps(
+                bm_obj.to_json(saving_file_storage=True))
+            bm_obj.mark_clean()
+        return FileStorage.__serialized[bm_id]
 
     def save(self):
         """
-            serializes __objects to the JSON file (path: __file_path)
+            serializes __objects to the JSON file (path: __file_path),
+            or appends the changes since the last save to the journal;
+            deferred to the end of the transaction inside transaction()
+        """
+        if getattr(FileStorage.__tx, 'depth', 0):
+            return
+        with self.__lock():
+            if (FileStorage.JOURNAL and
+                    os.path.isfile(FileStorage.__file_path)):
+                self.__append_journal()
+            else:
+                self.compact()
+
+    @contextmanager
+    def transaction(self):
+        """
+            defers save() until the outermost transaction block of this
+            thread exits, then saves once; discards the changes if the
+            block raises or the save fails. The block holds __thread_lock,
+            so new(), delete() and save() of other threads wait for it
+            instead of joining the transaction
+        """
+        tx = FileStorage.__tx
+        with FileStorage.__thread_lock:
+            tx.depth = getattr(tx, 'depth', 0) + 1
+            if tx.depth == 1:
+                tx.after_commit = []
+            try:
+                yield self
+            except Exception:
+                tx.depth -= 1
+                if not tx.depth:
+                    self.__rollback_tx()
+                raise
+            tx.depth -= 1
+            if tx.depth:
+                return
+            try:
+                self.save()
+            except Exception:
+                self.__rollback_tx()
+                raise
+        callbacks = tx.after_commit
+        tx.after_commit = []
+        for callback in callbacks:
+            callback()
+
+    def __rollback_tx(self):
+        """
+            private: drops the transaction's callbacks and changes
+        """
+        FileStorage.__tx.after_commit = []
+        self.rollback_session()
+
+    def after_commit(self, callback):
+        """
+            calls callback now, or once the current transaction is saved
+        """
+        if getattr(FileStorage.__tx, 'depth', 0):
+            FileStorage.__tx.after_commit.append(callback)
+        else:
+            callback()
+
+    def __append_journal(self):
+        """
+            private: appends one line per changed or deleted object to
+            the journal, compacts once it is larger than JOURNAL_MAX
+        """
+        changed, FileStorage.__changed = FileStorage.__changed, set()
+        deleted, FileStorage.__deleted = FileStorage.__deleted, set()
+        lines = []
+        for bm_id in changed:
+            bm_obj = FileStorage.__objects.get(bm_id)
+            if bm_obj is not None and bm_obj.is_dirty():
+                lines.append('{{"key": {}, "obj": {}}}\n'.format(
+                    json.dumps(bm_id), self.__serialize(bm_id, bm_obj)))
+        for bm_id in deleted:
+            lines.append(json.dumps({'key': bm_id, 'obj': None}) + '\n')
+        if not lines:
+            return
+        up_to_date = not self.__disk_changed()
+        jname = FileStorage.__journal_path
+        with open(jname, mode='a+b') as f_io:
+            if f_io.seek(0, os.SEEK_END) > 0:
+                f_io.seek(-1, os.SEEK_END)
+                if f_io.read(1) != b'\n':
+                    lines.insert(0, '\n')
+            f_io.write(''.join(lines).encode('utf-8'))
+            size = f_io.tell()
+            self.__fsync(f_io)
+        if up_to_date:
+            FileStorage.__disk_sig = self.__signature()
+        else:
+            FileStorage.__in_sync = False
+        if size > FileStorage.JOURNAL_MAX:
+            self.compact()
+
+    def __fsync(self, f_io, force=False):
+        """
+            private: flushes f_io and fsyncs it if the FSYNC policy asks
+            for it, or if force unless the policy is 'never', returns True
+            if it did
+        """
+        f_io.flush()
+        if FileStorage.FSYNC == 'never':
+            return False
+        now = time.time()
+        if not force and FileStorage.FSYNC != 'always':
+            since_ms = (now - FileStorage.__last_fsync) * 1000
+            if since_ms < float(FileStorage.FSYNC):
+                return False
+        os.fsync(f_io.fileno())
+        FileStorage.__last_fsync = now
+        return True
+
+    def compact(self):
+        """
+            writes every object to a fresh JSON snapshot (path: __file_path)
+            through a temporary file renamed over it, and empties the journal.
+            Changes another process wrote since the last reload are merged
+            in first.
+        """
+        with self.__lock():
+            merged = self.__disk_changed()
+            if merged:
+                self.__merge_disk()
+            self.__write_snapshot()
+        if merged:
+            self.__run_reload_hooks()
+
+    def __write_snapshot(self):
+        """
+            private: writes __objects to __file_path atomically and removes
+            the journal, the caller holds the exclusive lock
         """
         fname = FileStorage.__file_path
-        storage_d = {}
-        for bm_id, bm_obj in FileStorage.__objects.items():
-            storage_d[bm_id] = bm_obj.to_json(saving_file_storage=True)
-        with open(fname, mode='w', encoding='utf-8') as f_io:
-            json.dump(storage_d, f_io)
+        tmp_name = '{}.{}.{}.tmp'.format(
+            fname, os.getpid(), threading.get_ident())
+        items = ['{}: {}'.format(json.dumps(bm_id),
+                                 self.__serialize(bm_id, bm_obj))
+                 for bm_id, bm_obj in list(FileStorage.__objects.items())]
+        with open(tmp_name, mode='w', encoding='utf-8') as f_io:
+            f_io.write('{' + ', '.join(items) + '}')
+            synced = self.__fsync(f_io, force=True)
+        os.replace(tmp_name, fname)
+        if synced:
+            dir_fd = os.open(os.path.dirname(fname) or '.', os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        if os.path.isfile(FileStorage.__journal_path):
+            os.remove(FileStorage.__journal_path)
+        FileStorage.__changed = set()
+        FileStorage.__deleted = set()
+        FileStorage.__disk_sig = self.__signature()
+        FileStorage.__in_sync = True
+
+    def __merge_disk(self):
+        """
+            private: reloads what is on disk, then re-applies the objects
+            added and deleted here since the last save
+        """
+        pending = {bm_id: FileStorage.__objects[bm_id]
+                   for bm_id in FileStorage.__changed
+                   if bm_id in FileStorage.__objects}
+        deleted = FileStorage.__deleted
+        self.__load()
+        for bm_id, bm_obj in pending.items():
+            self.__unregister(bm_id)
+            self.__register(bm_id, bm_obj)
+        for bm_id in deleted:
+            self.__unregister(bm_id)
+        FileStorage.__changed = set(pending)
+        FileStorage.__deleted = deleted
+
+    @contextmanager
+    def __lock(self, exclusive=True):
+        """
+            private: holds __thread_lock and an flock on __lock_path,
+            exclusive for writers, shared for readers; nested calls of the
+            same thread reuse the outer lock
+        """
+        local = FileStorage.__local
+        with FileStorage.__thread_lock:
+            depth = getattr(local, 'lock_depth', 0)
+            if fcntl is None or depth:
+                local.lock_depth = depth + 1
+                try:
+                    yield
+                finally:
+                    local.lock_depth = depth
+                return
+            with open(FileStorage.__lock_path, mode='a') as f_lock:
+                fcntl.flock(f_lock,
+                            fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                local.lock_depth = 1
+                try:
+                    yield
+                finally:
+                    local.lock_depth = 0
+                    fcntl.flock(f_lock, fcntl.LOCK_UN)
+
+    def __signature(self):
+        """
+            private: (inode, size, mtime) of the snapshot and the journal,
+            changes whenever any process writes either of them
+        """
+        sig = []
+        for fname in (FileStorage.__file_path, FileStorage.__journal_path):
+            try:
+                f_stat = os.stat(fname)
+            except FileNotFoundError:
+                sig.append(None)
+                continue
+            sig.append((f_stat.st_ino, f_stat.st_size, f_stat.st_mtime_ns))
+        return tuple(sig)
+
+    def __disk_changed(self):
+        """
+            private: True if the files changed since this process last
+            read or wrote them
+        """
+        return self.__signature() != FileStorage.__disk_sig
 
     def reload(self):
         """
-            if file exists, deserializes JSON file to __objects, else nothing
+            if file exists, deserializes JSON file to __objects, then
+            replays the journal on top of it, else nothing.
+            An unreadable snapshot raises instead of starting empty.
+        """
+        with self.__lock(exclusive=False):
+            self.__load()
+
+    def refresh(self):
+        """
+            brings __objects up to date with the files: nothing to do if
+            they did not change since last read or written, replays only the
+            new journal records if another process just appended some, and
+            calls reload() otherwise or if changes here were never saved;
+            runs the RELOAD_HOOKS if another process wrote the files
+        """
+        disk_changed = self.__disk_changed()
+        if FileStorage.__changed or FileStorage.__deleted:
+            self.reload()
+        elif disk_changed:
+            with self.__lock(exclusive=False):
+                old_sig = FileStorage.__disk_sig
+                new_sig = self.__signature()
+                if self.__journal_grew(old_sig, new_sig):
+                    FileStorage.__disk_sig = new_sig
+                    FileStorage.__in_sync = True
+                    self.__replay_journal(old_sig[1][1] if old_sig[1] else 0)
+                else:
+                    self.__load()
+        if disk_changed:
+            self.__run_reload_hooks()
+
+    def __run_reload_hooks(self):
+        """
+            private: runs the RELOAD_HOOKS
+        """
+        for hook in FileStorage.RELOAD_HOOKS:
+            hook()
+
+    def __journal_grew(self, old_sig, new_sig):
+        """
+            private: True if between the two signatures the snapshot stayed
+            the same and the journal was only appended to
+        """
+        if old_sig is None or new_sig[0] != old_sig[0] or new_sig[1] is None:
+            return False
+        if old_sig[1] is None:
+            return True
+        return (new_sig[1][0] == old_sig[1][0] and
+                new_sig[1][1] >= old_sig[1][1])
+
+    def __load(self):
+        """
+            private: body of reload(), the caller holds a lock
         """
         fname = FileStorage.__file_path
         FileStorage.__objects = {}
+        FileStorage.__class_objects = {}
+        FileStorage.__fk_index = {}
+        FileStorage.__fk_values = {}
+        FileStorage.__sorted = {}
+        FileStorage.__epoch = uuid4().hex
+        FileStorage.__changed = set()
+        FileStorage.__deleted = set()
+        FileStorage.__serialized = {}
+        FileStorage.__disk_sig = self.__signature()
+        FileStorage.__in_sync = True
         try:
             with open(fname, mode='r', encoding='utf-8') as f_io:
-                new_objs = json.load(f_io)
-        except Exception:
+                content = f_io.read()
+        except FileNotFoundError:
             return
+        new_objs = json.loads(content) if content.strip() else {}
         for o_id, d in new_objs.items():
             k_cls = d['__class__']
-            FileStorage.__objects[o_id] = FileStorage.CNC[k_cls](**d)
+            self.__register(o_id, FileStorage.CNC[k_cls](**d))
+        self.__replay_journal()
+        for obj in FileStorage.__objects.values():
+            obj.mark_clean()
+
+    def __replay_journal(self, offset=0):
+        """
+            private: applies the journal records from byte offset on, in
+            order, skipping a line left partially written by a crash
+        """
+        try:
+            with open(FileStorage.__journal_path, mode='rb') as f_io:
+                f_io.seek(offset)
+                content = f_io.read().decode('utf-8', 'replace')
+        except FileNotFoundError:
+            return
+        for line in content.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            o_id, d = record['key'], record['obj']
+            self.__unregister(o_id)
+            if d is not None:
+                obj = FileStorage.CNC[d['__class__']](**d)
+                obj.mark_clean()
+                self.__register(o_id, obj)
 
     def delete(self, obj=None):
         """
@@ -82,42 +739,70 @@ class FileStorage:
         """
         if obj:
             obj_ref = "{}.{}".format(type(obj).__name__, obj.id)
-            all_class_objs = self.all(obj.__class__.__name__)
-            if all_class_objs.get(obj_ref):
-                del FileStorage.__objects[obj_ref]
-            self.save()
+            with FileStorage.__thread_lock:
+                if self.__unregister(obj_ref) is not None:
+                    FileStorage.__changed.discard(obj_ref)
+                    FileStorage.__deleted.add(obj_ref)
+                self.save()
+
+    def rollback_session(self):
+        """
+            discards the changes not written to file yet
+        """
+        FileStorage.__bulk = []
+        self.reload()
 
     def delete_all(self):
         """
             deletes all stored objects, for testing purposes
         """
-        try:
-            with open(FileStorage.__file_path, mode='w') as f_io:
-                pass
-        except Exception:
-            pass
-        del FileStorage.__objects
-        FileStorage.__objects = {}
-        self.save()
+        with self.__lock():
+            del FileStorage.__objects
+            FileStorage.__objects = {}
+            FileStorage.__class_objects = {}
+            FileStorage.__fk_index = {}
+            FileStorage.__fk_values = {}
+            FileStorage.__sorted = {}
+            FileStorage.__epoch = uuid4().hex
+            FileStorage.__serialized = {}
+            self.__write_snapshot()
+
+    def pool_stats(self):
+        """
+            returns None: file storage has no connection pool
+        """
+        return None
 
     def close(self):
         """
-            calls the reload() method for deserialization from JSON to objects
+            calls the refresh() method, deserializing from JSON to objects
+            again only if another process changed the files
         """
-        self.reload()
+        self.refresh()
 
-    def get(self, cls, id):
+    def get(self, cls, id, with_related=None):
         """
-            retrieves one object based on class name and id
+            retrieves one object based on class name and id; with_related
+            is accepted for DBStorage compatibility
         """
         if cls and id:
             fetch_obj = "{}.{}".format(cls, id)
-            all_obj = self.all(cls)
-            return all_obj.get(fetch_obj)
+            return FileStorage.__objects.get(fetch_obj)
         return None
 
     def count(self, cls=None):
         """
         count of all objects in storage
         """
-        return (len(self.all(cls)))
+        if cls is not None:
+            return len(FileStorage.__class_objects.get(cls, {}))
+        return len(FileStorage.__objects)
+
+    def count_by_class(self, classes=None):
+        """
+        returns { Class Name : count } for the given class names,
+        all stored classes if None
+        """
+        if classes is None:
+            classes = FileStorage.__class_objects.keys()
+        return {cls: self.count(cls) for cls in classes}
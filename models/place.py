@@ -5,7 +5,7 @@ Place Class from Models Module
 import os
 from models.base_model import BaseModel, Base
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
 
 # Determine the storage type from environment variables
 STORAGE_TYPE = os.environ.get('HBNB_TYPE_STORAGE')
@@ -18,6 +18,10 @@ if STORAGE_TYPE == "db":
         between Place and Amenity
         """
         __tablename__ = 'place_amenity'
+        # The primary key serves place_id lookups, this index the
+        # places of an amenity
+        __table_args__ = (Index('ix_place_amenity_amenity_id_place_id',
+                                'amenity_id', 'place_id'),)
         metadata = Base.metadata
         place_id = Column(String(60),
                           ForeignKey('places.id'),
@@ -35,14 +39,17 @@ class Place(BaseModel, Base):
     if STORAGE_TYPE == "db":
         # Define table name and columns for database storage
         __tablename__ = 'places'
-        city_id = Column(String(60), ForeignKey('cities.id'), nullable=False)
-        user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+        city_id = Column(String(60), ForeignKey('cities.id'), nullable=False,
+                         index=True)
+        user_id = Column(String(60), ForeignKey('users.id'), nullable=False,
+                         index=True)
         name = Column(String(128), nullable=False)
         description = Column(String(1024), nullable=True)
         number_rooms = Column(Integer, nullable=False, default=0)
         number_bathrooms = Column(Integer, nullable=False, default=0)
         max_guest = Column(Integer, nullable=False, default=0)
-        price_by_night = Column(Integer, nullable=False, default=0)
+        price_by_night = Column(Integer, nullable=False, default=0,
+                                index=True)
         latitude = Column(Float, nullable=True)
         longitude = Column(Float, nullable=True)
 
@@ -82,7 +89,7 @@ class Place(BaseModel, Base):
                 amenity ID if it's not already in the list
             """
             if amenity_obj and amenity_obj.id not in self.amenity_ids:
-                self.amenity_ids.append(amenity_obj.id)
+                self.amenity_ids = self.amenity_ids + [amenity_obj.id]
 
         @property
         def reviews(self):
@@ -101,4 +108,4 @@ class Place(BaseModel, Base):
                 ID if it's not already in the list
             """
             if review_obj and review_obj.id not in self.review_ids:
-                self.review_ids.append(review_obj.id)
+                self.review_ids = self.review_ids + [review_obj.id]
@@ -17,8 +17,10 @@ class Review(BaseModel, Base):
         # Define table name and columns for database storage
         __tablename__ = 'reviews'
         text = Column(String(1024), nullable=False)
-        place_id = Column(String(60), ForeignKey('places.id'), nullable=False)
-        user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+        place_id = Column(String(60), ForeignKey('places.id'), nullable=False,
+                          index=True)
+        user_id = Column(String(60), ForeignKey('users.id'), nullable=False,
+                         index=True)
     else:
         # Define attributes for file storage
         place_id = ''
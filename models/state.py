@@ -32,8 +32,5 @@ class State(BaseModel, Base):
             Getter method to retrieve list of City objects
             linked to the current State.
             """
-            city_list = []
-            for city in models.storage.all("City").values():
-                if city.state_id == self.id:
-                    city_list.append(city)
-            return city_list
+            return list(
+                models.storage.by_fk('City', 'state_id', self.id).values())
@@ -20,7 +20,7 @@ class User(BaseModel, Base):
     if STORAGE_TYPE == "db":
         # Define table name and columns for database storage
         __tablename__ = 'users'
-        email = Column(String(128), nullable=False)
+        email = Column(String(128), nullable=False, index=True)
         password = Column(String(128), nullable=False)
         first_name = Column(String(128), nullable=True)
         last_name = Column(String(128), nullable=True)
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+"""
+Unit Test for api v1 Flask App
+"""
+import inspect
+import pep8
+import web_flask
+import unittest
+import api
+from api.v1.app import app
+from models import storage
+from models.state import State
+from os import environ, stat
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
+module = api.v1.views.batch
+
+
+class TestBatchDocs(unittest.TestCase):
+    """Class for testing Batch Route docs"""
+
+    all_funcs = inspect.getmembers(module, inspect.isfunction)
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('.......  Batch API  .......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        actual = module.__doc__
+        self.assertIsNotNone(actual)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions"""
+        all_functions = TestBatchDocs.all_funcs
+        for function in all_functions:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8(self):
+        """... tests if file conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['api/v1/views/batch.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('api/v1/views/batch.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestBatchRoute(unittest.TestCase):
+    """Class for testing the batch route"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up a state to batch against"""
+        storage.delete_all()
+        cls.client = app.test_client()
+        cls.state = State(name="Texas")
+        cls.state.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+
+    def post(self, operations):
+        """returns the status and json of a batch request"""
+        response = self.client.post('/api/v1/batch', json=operations)
+        return response.status_code, response.get_json()
+
+    def test_batch_applied(self):
+        """... applies the operations, later ones can use created ids"""
+        status, results = self.post([
+            {'method': 'POST', 'class': 'City',
+             'data': {'id': 'austin', 'name': 'Austin',
+                      'state_id': self.state.id}},
+            {'method': 'PUT', 'class': 'City', 'id': 'austin',
+             'data': {'name': 'Austin TX'}}
+        ])
+        self.assertEqual(status, 200)
+        self.assertEqual([r['status'] for r in results], [201, 200])
+        self.assertEqual(storage.get('City', 'austin').name, 'Austin TX')
+        storage.reload()
+        self.assertEqual(storage.get('City', 'austin').name, 'Austin TX')
+        status, results = self.post(
+            [{'method': 'DELETE', 'class': 'City', 'id': 'austin'}])
+        self.assertEqual((status, results), (200, [{'status': 200,
+                                                    'object': {}}]))
+        self.assertIsNone(storage.get('City', 'austin'))
+
+    def test_batch_invalid(self):
+        """... applies nothing if one operation is invalid"""
+        count = storage.count('City')
+        status, results = self.post([
+            {'method': 'POST', 'class': 'City',
+             'data': {'name': 'Dallas', 'state_id': self.state.id}},
+            {'method': 'POST', 'class': 'City', 'data': {'name': 'Waco'}},
+            {'method': 'DELETE', 'class': 'State', 'id': 'nope'},
+            {'method': 'GET', 'class': 'State'}
+        ])
+        self.assertEqual(status, 400)
+        self.assertEqual(results, [
+            {'status': 424, 'error': 'Not applied'},
+            {'status': 400, 'error': 'Missing state_id'},
+            {'status': 404, 'error': 'Not found'},
+            {'status': 400, 'error': 'Invalid method'}])
+        self.assertEqual(storage.count('City'), count)
+
+    def test_batch_invalid_data(self):
+        """... rejects data the class cannot be created from"""
+        status, results = self.post([
+            {'method': 'POST', 'class': 'State', 'data': {'name': 'Ohio'}},
+            {'method': 'POST', 'class': 'State',
+             'data': {'name': 'Utah', 'created_at': 'bad'}}
+        ])
+        self.assertEqual(status, 400)
+        self.assertEqual(results, [
+            {'status': 424, 'error': 'Not applied'},
+            {'status': 400, 'error': 'Invalid data'}])
+
+
+if __name__ == '__main__':
+    """
+    MAIN TESTS
+    """
+    unittest.main
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+Unit Test for api v1 Flask App
+"""
+import inspect
+import pep8
+import web_flask
+import time
+import unittest
+from os import stat
+import api
+from api.v1.app import app
+module = api.v1.views.cache
+
+
+class TestCacheDocs(unittest.TestCase):
+    """Class for testing Cache helpers docs"""
+
+    all_funcs = inspect.getmembers(module, inspect.isfunction)
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('.......  Cache API  .......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        actual = module.__doc__
+        self.assertIsNotNone(actual)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions"""
+        all_functions = TestCacheDocs.all_funcs
+        for function in all_functions:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8(self):
+        """... tests if file conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['api/v1/views/cache.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('api/v1/views/cache.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Class for testing the response cache"""
+
+    def setUp(self):
+        """creates a cache of two entries"""
+        self.cache = module.ResponseCache(2)
+
+    def test_lru_eviction(self):
+        """... put() evicts the least recently used entry"""
+        cache = self.cache
+        cache.put('a', 1, ['State'], cache.version)
+        cache.put('b', 2, ['State'], cache.version)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3, ['State'], cache.version)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_invalidate_tags(self):
+        """... invalidate() drops only the entries with the tags"""
+        cache = self.cache
+        cache.put('a', 1, ['State', 'State.1'], cache.version)
+        cache.put('b', 2, ['City'], cache.version)
+        cache.invalidate('State.1')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        cache.clear()
+        self.assertIsNone(cache.get('b'))
+
+    def test_put_after_invalidate(self):
+        """... put() skips values computed before an invalidation"""
+        cache = self.cache
+        version = cache.version
+        cache.invalidate('City')
+        cache.put('a', 1, ['State'], version)
+        self.assertIsNone(cache.get('a'))
+
+    def test_ttl(self):
+        """... get() drops entries older than the ttl"""
+        cache = module.ResponseCache(2, ttl=0.01)
+        cache.put('a', 1, ['State'], cache.version)
+        self.assertEqual(cache.get('a'), 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_cleared_on_reload(self):
+        """... the app cache is cleared when storage loads other writes"""
+        self.assertIn(module.response_cache.clear,
+                      module.FileStorage.RELOAD_HOOKS)
+
+    def test_disabled(self):
+        """... a cache of size 0 keeps nothing"""
+        cache = module.ResponseCache()
+        cache.put('a', 1, ['State'], cache.version)
+        self.assertIsNone(cache.get('a'))
+
+
+if __name__ == '__main__':
+    """
+    MAIN TESTS
+    """
+    unittest.main
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Unit Test for api v1 Flask App
+"""
+import inspect
+import pep8
+import web_flask
+import unittest
+from datetime import datetime
+from os import stat
+import api
+from api.v1.app import app
+module = api.v1.views.conditional
+
+
+class TestConditionalDocs(unittest.TestCase):
+    """Class for testing Conditional helpers docs"""
+
+    all_funcs = inspect.getmembers(module, inspect.isfunction)
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('.......  Conditional API  .......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        actual = module.__doc__
+        self.assertIsNotNone(actual)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions"""
+        all_functions = TestConditionalDocs.all_funcs
+        for function in all_functions:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8(self):
+        """... tests if file conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['api/v1/views/conditional.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('api/v1/views/conditional.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+class TestConditional(unittest.TestCase):
+    """Class for testing conditional responses"""
+
+    when = datetime(2017, 3, 25, 2, 17, 6, 1234)
+
+    def status(self, headers, last_modified=None):
+        """returns the status not_modified() answers for headers"""
+        etag = module.make_etag('State', 'id', self.when)
+        with app.test_request_context('/api/v1/states', headers=headers):
+            response = module.not_modified(etag, last_modified)
+            return response.status_code if response else 200
+
+    def test_if_none_match(self):
+        """... not_modified() answers 304 when If-None-Match matches"""
+        etag = module.make_etag('State', 'id', self.when)
+        self.assertEqual(self.status({'If-None-Match': '"{}"'.format(etag)}),
+                         304)
+        self.assertEqual(self.status({'If-None-Match': '*'}), 304)
+        self.assertEqual(self.status({'If-None-Match': '"other"'}), 200)
+        self.assertEqual(self.status({}), 200)
+
+    def test_if_modified_since(self):
+        """... not_modified() compares If-Modified-Since to the second"""
+        since = {'If-Modified-Since': 'Sat, 25 Mar 2017 02:17:06 GMT'}
+        self.assertEqual(self.status(since, self.when), 304)
+        self.assertEqual(self.status(since), 200)
+        later = self.when.replace(second=7)
+        self.assertEqual(self.status(since, later), 200)
+
+
+if __name__ == '__main__':
+    """
+    MAIN TESTS
+    """
+    unittest.main
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+"""
+Unit Test for api v1 Flask App
+"""
+import inspect
+import pep8
+import web_flask
+import unittest
+from datetime import datetime
+from os import environ, stat
+import api
+from api.v1.app import app
+from models import storage
+from models.state import State
+from werkzeug.exceptions import BadRequest
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
+module = api.v1.views.paging
+
+
+class TestPagingDocs(unittest.TestCase):
+    """Class for testing Paging helpers docs"""
+
+    all_funcs = inspect.getmembers(module, inspect.isfunction)
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('.......  Paging API  .......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        actual = module.__doc__
+        self.assertIsNotNone(actual)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions"""
+        all_functions = TestPagingDocs.all_funcs
+        for function in all_functions:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8(self):
+        """... tests if file conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['api/v1/views/paging.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('api/v1/views/paging.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+class TestPagingCursor(unittest.TestCase):
+    """Class for testing the page cursor"""
+
+    def test_cursor_round_trip(self):
+        """... decode_cursor() returns what encode_cursor() was given"""
+        for created_at in [datetime(2017, 3, 25, 2, 17, 6, 1234),
+                           datetime(2017, 3, 25, 2, 17, 6)]:
+            obj = type('Obj', (), {'created_at': created_at, 'id': 'a|b'})
+            cursor = module.encode_cursor(obj)
+            self.assertEqual(module.decode_cursor(cursor),
+                             (created_at, 'a|b'))
+
+    def test_page_args(self):
+        """... page_args() reads limit and cursor, rejects bad values"""
+        with app.test_request_context('/api/v1/states'):
+            self.assertEqual(module.page_args(), (None, None))
+        with app.test_request_context('/api/v1/states?cursor='):
+            self.assertEqual(module.page_args(), (module.PAGE_SIZE, None))
+        for query in ['limit=0', 'limit=ten', 'limit=1&cursor=nope']:
+            with app.test_request_context('/api/v1/states?' + query):
+                self.assertRaises(BadRequest, module.page_args)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestPagingEtag(unittest.TestCase):
+    """Class for testing the ETag of list pages"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up three states to list"""
+        storage.delete_all()
+        cls.client = app.test_client()
+        cls.states = [State(name="State {}".format(i)) for i in range(3)]
+        for state in cls.states:
+            state.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+
+    def status(self, url, etag):
+        """returns the status of a GET of url made with If-None-Match"""
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        return response.status_code
+
+    def test_page_etag(self):
+        """... a page ETag only changes with the objects of the page"""
+        url = '/api/v1/states?limit=2'
+        etag = self.client.get(url).get_etag()[0]
+        self.states[2].name = "Texas"
+        self.states[2].save()
+        self.assertEqual(self.status(url, etag), 304)
+        self.states[0].name = "Utah"
+        self.states[0].save()
+        self.assertEqual(self.status(url, etag), 200)
+
+    def test_list_etag(self):
+        """... a full list ETag changes with any object of the class"""
+        url = '/api/v1/states'
+        etag = self.client.get(url).get_etag()[0]
+        self.assertEqual(self.status(url, etag), 304)
+        self.states[1].name = "Iowa"
+        self.states[1].save()
+        self.assertEqual(self.status(url, etag), 200)
+
+
+if __name__ == '__main__':
+    """
+    MAIN TESTS
+    """
+    unittest.main
@@ -6,8 +6,15 @@ import inspect
 import pep8
 import web_flask
 import unittest
-from os import stat
+from os import environ, stat
 import api
+from api.v1.app import app
+from models import storage
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
 module = api.v1.views.places
 
 
@@ -48,6 +55,46 @@ class TestPlacesDocs(unittest.TestCase):
         self.assertTrue(actual)
 
 
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestPlacesSearch(unittest.TestCase):
+    """Class for testing the places_search route"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up a place to search for"""
+        storage.delete_all()
+        cls.client = app.test_client()
+        state = State(name="Texas")
+        state.save()
+        city = City(name="Austin", state_id=state.id)
+        city.save()
+        user = User(email="a@b.c", password="pwd")
+        user.save()
+        cls.place = Place(name="Loft", city_id=city.id, user_id=user.id)
+        cls.place.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+
+    def search(self, body):
+        """returns the status and the ids of a places_search request"""
+        response = self.client.post('/api/v1/places_search', json=body)
+        if response.status_code != 200:
+            return response.status_code, None
+        return 200, [place['id'] for place in response.get_json()]
+
+    def test_invalid_ids_ignored(self):
+        """... ids that are not strings match nothing"""
+        for body in [{'states': [['x']]}, {'cities': [{'id': 1}]},
+                     {'amenities': [None, 2]}, {'states': 'x'}]:
+            self.assertEqual(self.search(body), (200, [self.place.id]))
+
+    def test_not_a_json_object(self):
+        """... a body that is not a JSON object is rejected"""
+        self.assertEqual(self.search(['states']), (400, None))
+
+
 if __name__ == '__main__':
     """
     MAIN TESTS
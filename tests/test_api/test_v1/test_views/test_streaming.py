@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Unit Test for api v1 Flask App
+"""
+import inspect
+import json
+import pep8
+import web_flask
+import unittest
+from os import stat
+import api
+from api.v1.app import app
+module = api.v1.views.streaming
+
+
+class TestStreamingDocs(unittest.TestCase):
+    """Class for testing Streaming helpers docs"""
+
+    all_funcs = inspect.getmembers(module, inspect.isfunction)
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('.......  Streaming API  .......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        actual = module.__doc__
+        self.assertIsNotNone(actual)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions"""
+        all_functions = TestStreamingDocs.all_funcs
+        for function in all_functions:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8(self):
+        """... tests if file conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['api/v1/views/streaming.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('api/v1/views/streaming.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+class Obj:
+    """stands in for a model object"""
+
+    def __init__(self, n):
+        """keeps n"""
+        self.n = n
+
+    def to_json(self):
+        """returns the object dictionary"""
+        return {'n': self.n}
+
+
+class TestStreamResponse(unittest.TestCase):
+    """Class for testing streamed responses"""
+
+    def body(self, count, headers=None):
+        """returns the streamed body of count objects"""
+        objs = [Obj(n) for n in range(count)]
+        with app.test_request_context('/api/v1/states', headers=headers):
+            response = module.stream_response(objs)
+            return response.mimetype, ''.join(response.response)
+
+    def test_json_array(self):
+        """... stream_response() sends a JSON array across chunks"""
+        for count in [0, 1, module.CHUNK_SIZE, module.CHUNK_SIZE * 2 + 1]:
+            mimetype, body = self.body(count)
+            self.assertEqual(mimetype, 'application/json')
+            self.assertEqual(json.loads(body),
+                             [{'n': n} for n in range(count)])
+
+    def test_ndjson(self):
+        """... stream_response() sends one object per line for NDJSON"""
+        headers = {'Accept': module.NDJSON}
+        for count in [0, 1, module.CHUNK_SIZE, module.CHUNK_SIZE * 2 + 1]:
+            mimetype, body = self.body(count, headers)
+            self.assertEqual(mimetype, module.NDJSON)
+            self.assertEqual([json.loads(line) for line in body.splitlines()],
+                             [{'n': n} for n in range(count)])
+            self.assertEqual(body.endswith('\n'), count > 0)
+
+
+if __name__ == '__main__':
+    """
+    MAIN TESTS
+    """
+    unittest.main
@@ -145,6 +145,65 @@ class TestBaseModelInstances(unittest.TestCase):
         actual = self.model.number
         self.assertTrue(98 == actual)
 
+    def test_to_json_values(self):
+        """... to_json keeps JSON types, stringifies everything else"""
+        self.model.number = 98
+        self.model.tags = ['a', 1]
+        self.model.ref = self.model.__class__
+        my_model_json = self.model.to_json()
+        self.assertEqual(my_model_json['number'], 98)
+        self.assertEqual(my_model_json['tags'], ['a', 1])
+        self.assertEqual(my_model_json['ref'], str(BaseModel))
+        self.assertEqual(my_model_json['created_at'],
+                         str(self.model.created_at))
+
+    def test_parse_timestamps(self):
+        """... stored timestamps parse with and without microseconds"""
+        model = BaseModel(created_at="2017-03-25 02:17:07.000123",
+                          updated_at="2017-03-25 02:17:07")
+        self.assertEqual(model.created_at,
+                         datetime(2017, 3, 25, 2, 17, 7, 123))
+        self.assertEqual(model.updated_at, datetime(2017, 3, 25, 2, 17, 7))
+        for value in ["2017-13-25 02:17:07", "2017-03-25T02:17:07",
+                      "2017-03-25 02:17:07x000123", "2017-03-25 02:17:+7",
+                      "2017-03-25 02:17: 7", "2017-03-25 02:17:07.+00001"]:
+            with self.assertRaises(ValueError):
+                BaseModel(created_at=value)
+
+    def test_dirty_on_creation(self):
+        """... a new instance is dirty until flushed"""
+        self.assertTrue(self.model.is_dirty())
+        self.model.mark_clean()
+        self.assertFalse(self.model.is_dirty())
+
+    def test_dirty_on_assignment(self):
+        """... assigning a new value flags the instance as dirty"""
+        self.model.mark_clean()
+        self.model.number = self.model.id
+        self.assertTrue(self.model.is_dirty())
+
+    def test_clean_on_same_value(self):
+        """... assigning the current value keeps the instance clean"""
+        self.model.mark_clean()
+        self.model.id = self.model.id
+        self.assertFalse(self.model.is_dirty())
+
+    def test_dirty_flag_not_exported(self):
+        """... the dirty flag is not part of to_json or str output"""
+        self.assertNotIn('_BaseModel__dirty', self.model.to_json())
+        self.assertNotIn('_BaseModel__dirty', str(self.model))
+
+    def test_change_hooks(self):
+        """... save() and delete() run the change hooks"""
+        calls = []
+        BaseModel.CHANGE_HOOKS.append(lambda *args: calls.append(args))
+        try:
+            self.model.save()
+            self.model.delete()
+        finally:
+            BaseModel.CHANGE_HOOKS.pop()
+        self.assertEqual(calls, [(self.model, False), (self.model, True)])
+
 if __name__ == '__main__':
     """
     MAIN TESTS
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""
+Unit Test for the DBStorage connection pool
+"""
+import unittest
+import inspect
+from os import environ, path, remove, stat
+import pep8
+from sqlalchemy import create_engine, exc, text
+from models.engine import db_pool
+from models.engine.db_pool import MeteredPool, PoolMetrics, pool_options
+
+DB = '/tmp/hbnb_test_db_pool.db'
+URL = 'sqlite:///{}'.format(DB)
+POOL_VARS = ('HBNB_DB_POOL_SIZE', 'HBNB_DB_MAX_OVERFLOW',
+             'HBNB_DB_POOL_TIMEOUT', 'HBNB_DB_POOL_RECYCLE',
+             'HBNB_DB_POOL_PRE_PING')
+
+
+class TestDBPoolDocs(unittest.TestCase):
+    """Class for testing db_pool docs"""
+
+    all_funcs = [f for c in (MeteredPool, PoolMetrics)
+                 for f in inspect.getmembers(c, inspect.isfunction)
+                 if f[1].__module__ == db_pool.__name__]
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('....... For DB Pool Module ......')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        self.assertIsNotNone(db_pool.__doc__)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions in db_pool file"""
+        for function in TestDBPoolDocs.all_funcs:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8_db_pool(self):
+        """... db_pool.py conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['models/engine/db_pool.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('models/engine/db_pool.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+class TestDBPool(unittest.TestCase):
+    """testing the metered pool against a SQLite database"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('....... Testing DB Pool .........')
+        print('.................................\n\n')
+
+    def setUp(self):
+        """saves the pool environment variables"""
+        self.saved = {var: environ.pop(var, None) for var in POOL_VARS}
+        self.engine = None
+
+    def tearDown(self):
+        """restores the environment and removes the database"""
+        for var, value in self.saved.items():
+            environ.pop(var, None)
+            if value is not None:
+                environ[var] = value
+        if self.engine is not None:
+            self.engine.dispose()
+        if path.isfile(DB):
+            remove(DB)
+
+    def make_engine(self, **env):
+        """returns an engine on the test database configured by env"""
+        environ.update(env)
+        self.engine = create_engine(URL, **pool_options(URL))
+        return self.engine
+
+    def test_pool_options(self):
+        """... pool_options() reads the HBNB_DB_POOL_* variables"""
+        environ.update(HBNB_DB_POOL_SIZE='3', HBNB_DB_MAX_OVERFLOW='0',
+                       HBNB_DB_POOL_RECYCLE='60',
+                       HBNB_DB_POOL_PRE_PING='0')
+        options = pool_options(URL)
+        self.assertIs(options['poolclass'], MeteredPool)
+        self.assertEqual(options['pool_size'], 3)
+        self.assertEqual(options['max_overflow'], 0)
+        self.assertEqual(options['pool_recycle'], 60)
+        self.assertFalse(options['pool_pre_ping'])
+        self.assertEqual(pool_options('sqlite://'), {})
+
+    def test_pool_defaults(self):
+        """... the pool pre-pings and recycles connections by default"""
+        options = pool_options(URL)
+        self.assertEqual(options['pool_size'], 5)
+        self.assertEqual(options['max_overflow'], 10)
+        self.assertEqual(options['pool_recycle'], 3600)
+        self.assertTrue(options['pool_pre_ping'])
+
+    def test_checkout_metrics(self):
+        """... stats() counts checkouts and connections"""
+        engine = self.make_engine(HBNB_DB_POOL_SIZE='2')
+        conn1 = engine.connect()
+        conn2 = engine.connect()
+        stats = engine.pool.stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['checked_out'], 2)
+        self.assertEqual(stats['connects'], 2)
+        conn1.close()
+        conn2.close()
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        stats = engine.pool.stats()
+        self.assertEqual(stats['checked_out'], 0)
+        self.assertEqual(stats['checkouts'], 3)
+        self.assertEqual(stats['connects'], 2)
+
+    def test_timeout(self):
+        """... a checkout waiting past the timeout is counted"""
+        engine = self.make_engine(HBNB_DB_POOL_SIZE='1',
+                                  HBNB_DB_MAX_OVERFLOW='0',
+                                  HBNB_DB_POOL_TIMEOUT='0.1')
+        conn = engine.connect()
+        with self.assertRaises(exc.TimeoutError):
+            engine.connect()
+        conn.close()
+        stats = engine.pool.stats()
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertGreaterEqual(stats['wait_max'], 0)
+
+    def test_invalidate_and_dispose(self):
+        """... invalidated connections are counted, dispose() keeps the
+        metrics without counting twice"""
+        engine = self.make_engine()
+        conn = engine.connect()
+        conn.invalidate()
+        conn.close()
+        self.assertEqual(engine.pool.stats()['invalidations'], 1)
+        engine.dispose()
+        engine.connect().close()
+        stats = engine.pool.stats()
+        self.assertEqual(stats['connects'], 2)
+        self.assertEqual(stats['checkouts'], 2)
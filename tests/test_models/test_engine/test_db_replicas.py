@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+"""
+Unit Test for the DBStorage read replica routing
+"""
+import unittest
+import inspect
+from datetime import datetime
+from os import environ, path, remove, stat
+import pep8
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from models.base_model import Base
+from models.engine import db_replicas
+from models.engine.db_replicas import Replica, ReplicaSet, RoutingSession
+from models.engine.db_storage import DBStorage
+from models.state import State
+
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
+PRIMARY = '/tmp/hbnb_test_primary.db'
+REPLICAS = ['/tmp/hbnb_test_replica0.db', '/tmp/hbnb_test_replica1.db']
+DOWN = 'sqlite:////tmp/hbnb_test_no_such_dir/replica.db'
+
+
+def url(db):
+    """returns the SQLAlchemy URL of the SQLite file db"""
+    return 'sqlite:///{}'.format(db)
+
+
+class TestDBReplicasDocs(unittest.TestCase):
+    """Class for testing db_replicas docs"""
+
+    all_funcs = [f for c in (Replica, ReplicaSet, RoutingSession)
+                 for f in inspect.getmembers(c, inspect.isfunction)
+                 if f[1].__module__ == db_replicas.__name__]
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('..... Testing Documentation .....')
+        print('..... For DB Replicas Module ....')
+        print('.................................\n\n')
+
+    def test_doc_file(self):
+        """... documentation for the file"""
+        self.assertIsNotNone(db_replicas.__doc__)
+
+    def test_all_function_docs(self):
+        """... tests for ALL DOCS for all functions in db_replicas file"""
+        for function in TestDBReplicasDocs.all_funcs:
+            self.assertIsNotNone(function[1].__doc__)
+
+    def test_pep8_db_replicas(self):
+        """... db_replicas.py conforms to PEP8 Style"""
+        pep8style = pep8.StyleGuide(quiet=True)
+        errors = pep8style.check_files(['models/engine/db_replicas.py'])
+        self.assertEqual(errors.total_errors, 0, errors.messages)
+
+    def test_file_is_executable(self):
+        """... tests if file has correct permissions so user can execute"""
+        file_stat = stat('models/engine/db_replicas.py')
+        permissions = str(oct(file_stat[0]))
+        actual = int(permissions[5:-2]) >= 5
+        self.assertTrue(actual)
+
+
+@unittest.skipIf(STORAGE_TYPE != 'db', 'skip if environ is not db')
+class TestDBReplicas(unittest.TestCase):
+    """testing the routing of reads with SQLite primary and replicas"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing DB Replicas ......')
+        print('.................................\n\n')
+
+    def setUp(self):
+        """creates the primary and replica databases, HBNB_ENV is cleared
+        so DBStorage does not drop the tables the tests seed"""
+        self.url = environ.get('HBNB_DB_URL')
+        self.env = environ.pop('HBNB_ENV', None)
+        environ['HBNB_DB_URL'] = url(PRIMARY)
+        self.engines = {}
+        for db in [PRIMARY] + REPLICAS:
+            self.engines[db] = create_engine(url(db), poolclass=NullPool)
+            Base.metadata.create_all(self.engines[db])
+        self.db = None
+
+    def tearDown(self):
+        """removes the databases"""
+        if self.db is not None:
+            self.db.close()
+        environ.pop('HBNB_DB_URL')
+        if self.url is not None:
+            environ['HBNB_DB_URL'] = self.url
+        if self.env is not None:
+            environ['HBNB_ENV'] = self.env
+        for db, engine in self.engines.items():
+            engine.dispose()
+            if path.isfile(db):
+                remove(db)
+
+    def make_storage(self, replica_urls):
+        """returns a storage reading from replica_urls"""
+        self.db = DBStorage(replica_urls)
+        self.db.reload()
+        return self.db
+
+    def add_states(self, db, count):
+        """inserts count states in the database db"""
+        now = datetime.utcnow()
+        with self.engines[db].begin() as conn:
+            for i in range(count):
+                conn.execute(
+                    text('INSERT INTO states (id, created_at, updated_at, '
+                         'name) VALUES (:id, :now, :now, :name)'),
+                    {'id': '{}-{}'.format(db, i), 'now': now,
+                     'name': 'State {}'.format(i)})
+
+    def count_states(self, db):
+        """returns the number of states in the database db"""
+        with self.engines[db].connect() as conn:
+            return conn.execute(text('SELECT count(*) FROM states')).scalar()
+
+    def test_reads_round_robin(self):
+        """... reads go to each replica in turn"""
+        self.add_states(REPLICAS[0], 1)
+        self.add_states(REPLICAS[1], 2)
+        db = self.make_storage([url(r) for r in REPLICAS])
+        counts = [db.count('State') for i in range(4)]
+        self.assertEqual([1, 2, 1, 2], counts)
+        self.assertEqual(1, len(db.all('State')))
+        self.assertIsNotNone(db.get('State', '{}-1'.format(REPLICAS[1])))
+        replicas = db.pool_stats()['replicas']['replicas']
+        self.assertEqual([3, 3], [r['reads'] for r in replicas])
+
+    def test_writes_go_to_primary(self):
+        """... writes go to the primary, which the session then reads"""
+        db = self.make_storage([url(r) for r in REPLICAS])
+        self.assertEqual(0, db.count('State'))
+        db.new(State(name="California"))
+        db.save()
+        self.assertEqual(1, self.count_states(PRIMARY))
+        self.assertEqual(0, self.count_states(REPLICAS[0]))
+        self.assertEqual(1, db.count('State'))
+        db.close()
+        self.assertEqual(0, db.count('State'))
+
+    def test_transaction_uses_primary(self):
+        """... reads in a transaction go to the primary"""
+        self.add_states(PRIMARY, 3)
+        db = self.make_storage([url(REPLICAS[0])])
+        with db.transaction():
+            self.assertEqual(3, db.count('State'))
+
+    def test_unhealthy_replica(self):
+        """... replicas that do not answer are skipped"""
+        self.add_states(REPLICAS[0], 1)
+        self.add_states(PRIMARY, 2)
+        db = self.make_storage([DOWN, url(REPLICAS[0])])
+        counts = [db.count('State') for i in range(4)]
+        self.assertEqual([1, 1, 1, 1], counts)
+        replicas = db.pool_stats()['replicas']['replicas']
+        self.assertFalse(replicas[0]['healthy'])
+        self.assertTrue(replicas[1]['healthy'])
+        db.close()
+        db = self.make_storage([DOWN])
+        self.assertEqual(2, db.count('State'))
+        self.assertEqual(1, db.pool_stats()['replicas']['primary_reads'])
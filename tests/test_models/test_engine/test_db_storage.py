@@ -6,10 +6,13 @@ import unittest
 from datetime import datetime
 from models import *
 import inspect
-from os import environ, stat
+from os import environ, path, remove, stat
 import pep8
 from models.base_model import Base
 from models.engine.db_storage import DBStorage
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
 
 STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
 
@@ -457,5 +460,298 @@ class TestCountGet(unittest.TestCase):
         expected = 8
         self.assertEqual(expected, count_all)
 
+    def test_count_by_class(self):
+        """... checks if count_by_class() counts each class in one call"""
+        counts = storage.count_by_class(['Place', 'State', 'Review'])
+        expected = {'Place': 2, 'State': 1, 'Review': 0}
+        self.assertEqual(expected, counts)
+
+    def test_pool_stats(self):
+        """... checks if pool_stats() reports the connection pool"""
+        storage.count('State')
+        stats = storage.pool_stats()
+        self.assertGreater(stats['checkouts'], 0)
+        self.assertEqual(stats['timeouts'], 0)
+
+    def test_by_fk(self):
+        """... checks if by_fk() returns the objects with the fk value"""
+        city_places = storage.by_fk('Place', 'city_id', self.c.id)
+        expected = sorted(['Place.{}'.format(self.p1.id),
+                           'Place.{}'.format(self.p2.id)])
+        self.assertEqual(expected, sorted(city_places.keys()))
+        self.assertEqual({}, storage.by_fk('Place', 'city_id', 'nope'))
+
+    def test_generation(self):
+        """... checks if generation() counts and dates the objects"""
+        count, latest = storage.generation('Place', 'city_id', self.c.id)
+        self.assertEqual(2, count)
+        self.assertEqual(max(self.p1.updated_at, self.p2.updated_at),
+                         latest)
+
+    def test_iter(self):
+        """... checks if iter() yields every object of the class"""
+        amenity_ids = [a.id for a in storage.iter('Amenity', batch_size=2)]
+        self.assertCountEqual([self.a1.id, self.a2.id, self.a3.id],
+                              amenity_ids)
+        self.assertEqual(storage.count(), len(list(storage.iter())))
+
+    def test_page(self):
+        """... checks if page() walks objects by (created_at, id)"""
+        amenities = sorted([self.a1, self.a2, self.a3],
+                           key=lambda a: (a.created_at, a.id))
+        first = storage.page('Amenity', 2)
+        self.assertEqual([a.id for a in amenities[:2]],
+                         [a.id for a in first])
+        after = (first[-1].created_at, first[-1].id)
+        rest = storage.page('Amenity', 2, after)
+        self.assertEqual([amenities[2].id], [a.id for a in rest])
+
+    def test_transaction_rollback(self):
+        """... checks if transaction() rolls back when the block raises"""
+        with self.assertRaises(ValueError):
+            with storage.transaction():
+                State(name="Nevada").save()
+                raise ValueError
+        self.assertEqual(1, storage.count('State'))
+        with storage.transaction():
+            state = State(name="Nevada")
+            state.save()
+        storage.close()
+        self.assertIsNotNone(storage.get('State', state.id))
+        state.delete()
+
+    def test_search_places(self):
+        """... checks if search_places() filters by state and amenity"""
+        self.p1.amenities.append(self.a1)
+        self.p1.save()
+        found = storage.search_places([self.s.id], None, [self.a1.id])
+        self.assertEqual([self.p1.id], [p.id for p in found])
+        found = storage.search_places([self.s.id])
+        self.assertEqual(2, len(found))
+
+    def test_search_places_unknown_ids(self):
+        """... checks if search_places() ignores unknown ids"""
+        self.p2.amenities.append(self.a2)
+        self.p2.save()
+        found = storage.search_places(['nope'], ['nope'])
+        self.assertEqual(2, len(found))
+        found = storage.search_places(None, [self.c.id], ['nope'])
+        self.assertIn(self.p2.id, [p.id for p in found])
+        self.assertTrue(all(p.amenities for p in found))
+
+
+@unittest.skipIf(STORAGE_TYPE != 'db', 'skip if environ is not db')
+class TestEagerLoading(unittest.TestCase):
+    """testing the with_related load options"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class for this round of tests"""
+        print('\n\n....................................')
+        print('.......... Testing DBStorage .......')
+        print('.......... with_related ............')
+        print('....................................')
+        storage.delete_all()
+        cls.u = User(email="betty@holbertonschool.com", password="pwd")
+        cls.u.save()
+        for i in range(3):
+            a_state = State(name="State {}".format(i))
+            a_state.save()
+            for j in range(2):
+                a_city = City(state_id=a_state.id, name="City {}".format(j))
+                a_city.save()
+        cls.p = Place(user_id=cls.u.id, city_id=a_city.id, name="a house")
+        cls.p.amenities.append(Amenity(name="Wifi"))
+        cls.p.amenities.append(Amenity(name="Cable"))
+        cls.p.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+
+    def setUp(self):
+        """starts each test with an empty session"""
+        storage.close()
+
+    def count_statements(self, function):
+        """returns the number of SQL statements function runs"""
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            """counts a statement"""
+            statements.append(statement)
+        event.listen(Engine, 'before_cursor_execute', count)
+        try:
+            function()
+        finally:
+            event.remove(Engine, 'before_cursor_execute', count)
+        return len(statements)
+
+    def test_lazy_cities(self):
+        """... checks that cities are loaded one state at a time"""
+        def read():
+            for a_state in storage.all('State').values():
+                self.assertEqual(2, len(a_state.cities))
+        self.assertEqual(4, self.count_statements(read))
+
+    def test_all_with_related(self):
+        """... checks if all() loads the related cities in one query"""
+        def read():
+            states = storage.all('State', with_related=['cities'])
+            for a_state in states.values():
+                self.assertEqual(2, len(a_state.cities))
+        self.assertEqual(2, self.count_statements(read))
+
+    def test_all_with_related_path(self):
+        """... checks if all() follows related paths"""
+        def read():
+            states = storage.all('State', with_related=['cities.places'])
+            places = [a_place.id for a_state in states.values()
+                      for a_city in a_state.cities
+                      for a_place in a_city.places]
+            self.assertEqual([self.p.id], places)
+        self.assertEqual(3, self.count_statements(read))
+
+    def test_get_with_related(self):
+        """... checks if get() loads the related amenities and user"""
+        def read():
+            a_place = storage.get('Place', self.p.id,
+                                  with_related=['amenities', 'user'])
+            self.assertEqual(2, len(a_place.amenities))
+            self.assertEqual(self.u.id, a_place.user.id)
+        self.assertEqual(2, self.count_statements(read))
+
+
+@unittest.skipIf(STORAGE_TYPE != 'db', 'skip if environ is not db')
+class TestIndexes(unittest.TestCase):
+    """testing the indexes declared by the models on SQLite"""
+
+    DB = '/tmp/hbnb_test_indexes.db'
+
+    @classmethod
+    def setUpClass(cls):
+        """creates the tables in a SQLite database"""
+        print('\n\n....................................')
+        print('.......... Testing DBStorage .......')
+        print('.......... Indexes .................')
+        print('....................................')
+        cls.url = environ.get('HBNB_DB_URL')
+        environ['HBNB_DB_URL'] = 'sqlite:///{}'.format(cls.DB)
+        cls.db = DBStorage()
+        cls.db.reload()
+        cls.engine = create_engine(environ['HBNB_DB_URL'],
+                                   poolclass=NullPool)
+
+    @classmethod
+    def tearDownClass(cls):
+        """removes the SQLite database"""
+        cls.db.close()
+        cls.engine.dispose()
+        environ.pop('HBNB_DB_URL')
+        if cls.url is not None:
+            environ['HBNB_DB_URL'] = cls.url
+        if path.isfile(cls.DB):
+            remove(cls.DB)
+
+    def query_plan(self, sql):
+        """returns the SQLite query plan of sql, on a new connection:
+        cached EXPLAIN statements do not see new indexes"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(text('EXPLAIN QUERY PLAN ' + sql))
+            return ' '.join(row[-1] for row in rows)
+
+    def test_explain(self):
+        """... checks if the API lookups use an index"""
+        plans = {
+            "SELECT id FROM cities WHERE state_id = 'a'":
+            'ix_cities_state_id',
+            "SELECT id FROM places WHERE city_id = 'a'":
+            'ix_places_city_id',
+            "SELECT id FROM places WHERE user_id = 'a'":
+            'ix_places_user_id',
+            "SELECT id FROM places WHERE price_by_night < 100":
+            'ix_places_price_by_night',
+            "SELECT id FROM reviews WHERE place_id = 'a'":
+            'ix_reviews_place_id',
+            "SELECT id FROM reviews WHERE user_id = 'a'":
+            'ix_reviews_user_id',
+            "SELECT id FROM users WHERE email = 'a'":
+            'ix_users_email',
+            "SELECT place_id FROM place_amenity WHERE amenity_id = 'a'":
+            'COVERING INDEX ix_place_amenity_amenity_id_place_id'
+        }
+        for sql, index in plans.items():
+            with self.subTest(sql=sql):
+                self.assertIn(index, self.query_plan(sql))
+
+    def test_ensure_indexes(self):
+        """... checks if ensure_indexes() adds the missing indexes once"""
+        with self.engine.begin() as conn:
+            conn.execute(text('DROP INDEX ix_users_email'))
+            conn.execute(text('DROP INDEX '
+                              'ix_place_amenity_amenity_id_place_id'))
+        self.assertNotIn('ix_users_email',
+                         self.query_plan("SELECT id FROM users "
+                                         "WHERE email = 'a'"))
+        created = self.db.ensure_indexes()
+        self.assertEqual(['ix_users_email',
+                          'ix_place_amenity_amenity_id_place_id'], created)
+        self.assertEqual([], self.db.ensure_indexes())
+        self.assertIn('ix_users_email',
+                      self.query_plan("SELECT id FROM users "
+                                      "WHERE email = 'a'"))
+
+
+@unittest.skipIf(STORAGE_TYPE != 'db', 'skip if environ is not db')
+class TestBulk(unittest.TestCase):
+    """testing bulk_new() and bulk_save()"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class for this round of tests"""
+        print('\n\n....................................')
+        print('.......... Testing DBStorage .......')
+        print('.......... Bulk Inserts ............')
+        print('....................................')
+        storage.delete_all()
+
+    def tearDown(self):
+        """removes the inserted objects"""
+        storage.close()
+        storage.delete_all()
+
+    def test_bulk_save(self):
+        """... checks if bulk_save() inserts parents first, in chunks"""
+        states = [State(name="State {}".format(i)) for i in range(20)]
+        cities = [City(state_id=states[i % 20].id, name="City {}".format(i))
+                  for i in range(30)]
+        storage.bulk_new(cities + states)
+        self.assertEqual(0, storage.count('City'))
+        inserts = []
+
+        def record(conn, cursor, statement, *args):
+            """records the INSERT statements"""
+            if statement.startswith('INSERT'):
+                inserts.append(statement.split()[2])
+        chunk = DBStorage.BULK_CHUNK
+        DBStorage.BULK_CHUNK = 7
+        event.listen(Engine, 'before_cursor_execute', record)
+        try:
+            storage.bulk_save()
+        finally:
+            event.remove(Engine, 'before_cursor_execute', record)
+            DBStorage.BULK_CHUNK = chunk
+        self.assertEqual(['states'] * 3 + ['cities'] * 6, inserts)
+        storage.close()
+        self.assertEqual(20, storage.count('State'))
+        self.assertEqual(30, storage.count('City'))
+
+    def test_bulk_rollback(self):
+        """... checks if rollback_session() drops the queued objects"""
+        storage.bulk_new([State(name="Nevada")])
+        storage.rollback_session()
+        storage.bulk_save()
+        self.assertEqual(0, storage.count('State'))
+
 if __name__ == '__main__':
     unittest.main
@@ -7,10 +7,13 @@ from datetime import datetime
 import inspect
 import json
 import models
+import os
+import threading
+from unittest import mock
 from models import engine
-from models.engine.file_storage import FileStorage
+from models.engine.file_storage import FileStorage, fsync_policy
 import pep8
-from os import environ, stat, remove, path
+from os import environ, listdir, stat, remove, path
 
 User = models.user.User
 BaseModel = models.base_model.BaseModel
@@ -21,6 +24,7 @@ if STORAGE_TYPE != 'db':
     FileStorage = models.file_storage.FileStorage
 storage = models.storage
 F = './dev/file.json'
+J = './dev/file.json.log'
 
 
 @unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is not db')
@@ -235,6 +239,17 @@ class TestUserFsInstances(unittest.TestCase):
         actual = duplicate.id
         self.assertEqual(expected, actual)
 
+    def test_count_by_class(self):
+        """... checks count_by_class method with class names"""
+        counts = storage.count_by_class(['User', 'BaseModel', 'State'])
+        expected = {'User': 1, 'BaseModel': 1, 'State': 0}
+        self.assertEqual(expected, counts)
+
+    def test_get_missing_id(self):
+        """... checks get method returns None for an unknown id"""
+        self.assertIsNone(storage.get('User', 'not-an-id'))
+        self.assertIsNone(storage.get('State', self.user.id))
+
     def test_all(self):
         """... checks if all() function returns newly created instance"""
         u_id = self.user.id
@@ -273,5 +288,745 @@ class TestUserFsInstances(unittest.TestCase):
         self.assertTrue(actual)
 
 
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsClassPartition(unittest.TestCase):
+    """testing the per-class object registry"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('..... Per-Class Registry ........')
+        print('.................................\n\n')
+        storage.delete_all()
+        cls.state = State(name="Texas")
+        cls.state.save()
+        cls.user = User()
+        cls.user.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def test_all_cls_only_class(self):
+        """... all() with class name returns only that class"""
+        state_objs = storage.all('State')
+        self.assertEqual(list(state_objs.keys()),
+                         ['State.{}'.format(self.state.id)])
+
+    def test_all_no_cls_combined(self):
+        """... all() without class name returns every class"""
+        all_objs = storage.all()
+        self.assertIn('State.{}'.format(self.state.id), all_objs)
+        self.assertIn('User.{}'.format(self.user.id), all_objs)
+
+    def test_iter_cls(self):
+        """... iter() yields the objects of the class or of every class"""
+        self.assertEqual(list(storage.iter('State')), [self.state])
+        self.assertCountEqual(list(storage.iter()),
+                              list(storage.all().values()))
+
+    def test_iter_skips_deleted(self):
+        """... iter() skips objects deleted while iterating"""
+        state = State(name="Utah")
+        state.save()
+        for obj in storage.iter('State'):
+            if obj is self.state:
+                state.delete()
+            else:
+                self.assertIsNot(obj, state)
+
+    def test_all_cls_unknown(self):
+        """... all() with an unstored class name returns empty dict"""
+        self.assertEqual(storage.all('Review'), {})
+
+    def test_delete_updates_partition(self):
+        """... delete() removes object from its class partition"""
+        state = State(name="Ohio")
+        state.save()
+        self.assertEqual(storage.count('State'), 2)
+        state.delete()
+        self.assertEqual(storage.count('State'), 1)
+        self.assertIsNone(storage.get('State', state.id))
+
+    def test_reload_rebuilds_partition(self):
+        """... reload() rebuilds the class partitions from file"""
+        storage.save()
+        storage.reload()
+        self.assertEqual(storage.count('State'), 1)
+        self.assertEqual(storage.count('User'), 1)
+        self.assertEqual(storage.get('User', self.user.id).id, self.user.id)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsForeignKeys(unittest.TestCase):
+    """testing the foreign key indexes"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('...... Foreign Key Index ........')
+        print('.................................\n\n')
+        storage.delete_all()
+        cls.state = State(name="Texas")
+        cls.state.save()
+        cls.other = State(name="Ohio")
+        cls.other.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def test_by_fk_new_and_delete(self):
+        """... by_fk() follows new and deleted objects"""
+        city = models.city.City(name="Austin", state_id=self.state.id)
+        city.save()
+        key = 'City.{}'.format(city.id)
+        self.assertIn(key, storage.by_fk('City', 'state_id', self.state.id))
+        self.assertEqual(self.state.cities, [city])
+        city.delete()
+        self.assertEqual(storage.by_fk('City', 'state_id', self.state.id),
+                         {})
+
+    def test_by_fk_moved_object(self):
+        """... by_fk() reindexes an object saved with a new value"""
+        city = models.city.City(name="Dallas", state_id=self.state.id)
+        city.save()
+        city.state_id = self.other.id
+        city.save()
+        self.assertEqual(storage.by_fk('City', 'state_id', self.state.id),
+                         {})
+        self.assertEqual(self.other.cities, [city])
+        city.delete()
+
+    def test_by_fk_after_reload(self):
+        """... reload() rebuilds the foreign key indexes"""
+        city = models.city.City(name="Houston", state_id=self.state.id)
+        city.save()
+        storage.reload()
+        self.assertEqual(
+            list(storage.by_fk('City', 'state_id', self.state.id).keys()),
+            ['City.{}'.format(city.id)])
+        storage.get('City', city.id).delete()
+
+    def test_generation(self):
+        """... generation() changes with the indexed objects"""
+        before = storage.generation('City', 'state_id', self.state.id)
+        city = models.city.City(name="Waco", state_id=self.state.id)
+        city.save()
+        after = storage.generation('City', 'state_id', self.state.id)
+        self.assertEqual(after[0], before[0] + 1)
+        self.assertNotEqual(after[1], before[1])
+        city.name = "Austin"
+        city.save()
+        self.assertNotEqual(
+            storage.generation('City', 'state_id', self.state.id)[1],
+            after[1])
+        city.delete()
+        after = storage.generation('City', 'state_id', self.state.id)
+        self.assertEqual(after[0], before[0])
+        self.assertNotEqual(after[1], before[1])
+
+    def test_generation_shared(self):
+        """... processes that loaded the same files share a generation,
+        unsaved changes give a version of this process only"""
+        before = storage.generation('State')
+        storage.reload()
+        self.assertEqual(storage.generation('State'), before)
+        storage.get('State', self.state.id).name = "Tejas"
+        changed = storage.generation('State')
+        self.assertNotEqual(changed, before)
+        self.assertEqual(changed[1][0], os.getpid())
+        storage.reload()
+        self.assertEqual(storage.generation('State'), before)
+
+    def test_unhashable_fk_values(self):
+        """... values that are not strings are saved but not indexed"""
+        city = models.city.City(name="Dallas", state_id=self.state.id)
+        city.save()
+        place = models.place.Place(name="Loft", city_id=city.id,
+                                   user_id="u", amenity_ids=[["a"]])
+        place.save()
+        place.amenity_ids = [{"x": 1}, "a"]
+        place.save()
+        key = 'Place.{}'.format(place.id)
+        self.assertIn(key, storage.by_fk('Place', 'city_id', city.id))
+        self.assertIn(key, storage.by_fk('Place', 'amenity_ids', 'a'))
+        self.assertEqual(storage.by_fk('Place', 'amenity_ids', ['a']), {})
+        storage.reload()
+        self.assertEqual(storage.get('Place', place.id).amenity_ids,
+                         [{"x": 1}, "a"])
+        self.assertIn(key, storage.by_fk('Place', 'city_id', city.id))
+        storage.get('Place', place.id).delete()
+        storage.get('City', city.id).delete()
+
+    def test_by_fk_unindexed_attr(self):
+        """... by_fk() scans the class for attributes without index"""
+        self.assertEqual(
+            list(storage.by_fk('State', 'name', 'Texas').keys()),
+            ['State.{}'.format(self.state.id)])
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsBulk(unittest.TestCase):
+    """testing bulk_new() and bulk_save()"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('......... Bulk Inserts ..........')
+        print('.................................\n\n')
+        storage.delete_all()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def test_bulk_save(self):
+        """... bulk_save() saves the objects of bulk_new(), given as a
+        generator, and runs their change hooks"""
+        changed = []
+
+        def hook(obj, deleted):
+            """records the changed objects"""
+            changed.append(obj.id)
+        BaseModel.CHANGE_HOOKS.append(hook)
+        try:
+            states = [State(name="State {}".format(i)) for i in range(50)]
+            storage.bulk_new(state for state in states)
+            self.assertEqual(50, storage.count('State'))
+            self.assertEqual([], changed)
+            storage.bulk_save()
+        finally:
+            BaseModel.CHANGE_HOOKS.remove(hook)
+        self.assertEqual(sorted(s.id for s in states), sorted(changed))
+        storage.reload()
+        self.assertEqual(50, storage.count('State'))
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsTransaction(unittest.TestCase):
+    """testing storage transactions"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('......... Transactions ..........')
+        print('.................................\n\n')
+        storage.delete_all()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def on_disk(self, state):
+        """returns True if state is in the snapshot or the journal"""
+        key = 'State.{}'.format(state.id)
+        with open(F, mode='r', encoding='utf-8') as f_obj:
+            found = key in json.load(f_obj)
+        if path.isfile(J):
+            with open(J, mode='r', encoding='utf-8') as f_obj:
+                for line in f_obj:
+                    record = json.loads(line)
+                    if record['key'] == key:
+                        found = record['obj'] is not None
+        return found
+
+    def test_transaction_saves_once(self):
+        """... saves are deferred to the end of the outermost block"""
+        calls = []
+        with storage.transaction():
+            state = State(name="Texas")
+            state.save()
+            with storage.transaction():
+                State(name="Ohio").save()
+            storage.after_commit(lambda: calls.append(1))
+            self.assertFalse(self.on_disk(state))
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [1])
+        self.assertTrue(self.on_disk(state))
+
+    def test_transaction_rollback(self):
+        """... an exception discards the changes of the block"""
+        calls = []
+        with self.assertRaises(ValueError):
+            with storage.transaction():
+                state = State(name="Utah")
+                state.save()
+                storage.after_commit(lambda: calls.append(1))
+                raise ValueError
+        self.assertIsNone(storage.get('State', state.id))
+        self.assertEqual(calls, [])
+        state.save()
+        self.assertTrue(self.on_disk(state))
+
+    def test_other_thread_waits(self):
+        """... another thread's save() waits for the transaction and is
+        not rolled back with it"""
+        other = State(name="Iowa")
+        thread = threading.Thread(target=other.save)
+        with self.assertRaises(ValueError):
+            with storage.transaction():
+                State(name="Idaho").save()
+                thread.start()
+                thread.join(0.1)
+                self.assertTrue(thread.is_alive())
+                raise ValueError
+        thread.join()
+        self.assertTrue(self.on_disk(other))
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsPage(unittest.TestCase):
+    """testing keyset pagination"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('.......... Pagination ...........')
+        print('.................................\n\n')
+        storage.delete_all()
+        cls.states = [State(name="State {}".format(i)) for i in range(7)]
+        for state in cls.states:
+            state.save()
+        cls.states.sort(key=lambda state: (state.created_at, state.id))
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def walk(self, *args):
+        """returns every object of the pages of 3 objects"""
+        objs = []
+        page = storage.page('State', 3, None, *args)
+        while page:
+            objs.extend(page)
+            after = (page[-1].created_at, page[-1].id)
+            page = storage.page('State', 3, after, *args)
+        return objs
+
+    def test_page_order(self):
+        """... page() walks every object by (created_at, id)"""
+        self.assertEqual(self.walk(), self.states)
+
+    def test_page_by_attribute(self):
+        """... page() walks objects with the attribute value"""
+        self.assertEqual(self.walk('name', 'State 3'), [self.states[3]])
+
+    def test_page_follows_changes(self):
+        """... page() sees objects added and deleted after first use"""
+        self.walk()
+        state = State(name="State 7")
+        state.save()
+        self.assertEqual(self.walk()[-1], state)
+        state.delete()
+        self.assertEqual(self.walk(), self.states)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsSearchPlaces(unittest.TestCase):
+    """testing the indexed places search"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('........ Places Search ..........')
+        print('.................................\n\n')
+        storage.delete_all()
+        cls.s1 = State(name="Texas")
+        cls.s2 = State(name="Ohio")
+        cls.c1 = models.city.City(name="Austin", state_id=cls.s1.id)
+        cls.c2 = models.city.City(name="Dayton", state_id=cls.s2.id)
+        cls.a1 = models.amenity.Amenity(name="Wifi")
+        cls.a2 = models.amenity.Amenity(name="Pool")
+        cls.p1 = models.place.Place(name="one", city_id=cls.c1.id,
+                                    amenity_ids=[cls.a1.id, cls.a2.id])
+        cls.p2 = models.place.Place(name="two", city_id=cls.c1.id,
+                                    amenity_ids=[cls.a1.id])
+        cls.p3 = models.place.Place(name="three", city_id=cls.c2.id)
+        for obj in [cls.s1, cls.s2, cls.c1, cls.c2, cls.a1, cls.a2,
+                    cls.p1, cls.p2, cls.p3]:
+            obj.save()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def test_search_no_filter(self):
+        """... search_places() without filters returns every place"""
+        self.assertCountEqual(storage.search_places(),
+                              [self.p1, self.p2, self.p3])
+
+    def test_search_states_and_cities(self):
+        """... search_places() joins state cities and given cities"""
+        self.assertCountEqual(storage.search_places([self.s1.id]),
+                              [self.p1, self.p2])
+        self.assertCountEqual(
+            storage.search_places([self.s1.id], [self.c2.id]),
+            [self.p1, self.p2, self.p3])
+
+    def test_search_amenities(self):
+        """... search_places() keeps places with every amenity"""
+        self.assertCountEqual(
+            storage.search_places(amenities=[self.a1.id, self.a2.id]),
+            [self.p1])
+        self.assertCountEqual(
+            storage.search_places([self.s2.id], amenities=[self.a1.id]),
+            [])
+
+    def test_search_follows_amenity_updates(self):
+        """... search_places() sees amenities added to a saved place"""
+        self.p3.amenities = self.a2
+        self.p3.save()
+        self.assertCountEqual(storage.search_places(amenities=[self.a2.id]),
+                              [self.p1, self.p3])
+        self.p3.amenity_ids = []
+        self.p3.save()
+        self.assertCountEqual(storage.search_places(amenities=[self.a2.id]),
+                              [self.p1])
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsJournal(unittest.TestCase):
+    """testing the append-only journal mode"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('......... Journal Mode ..........')
+        print('.................................\n\n')
+        cls.journal = FileStorage.JOURNAL
+        FileStorage.JOURNAL = True
+        storage.delete_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        """tidies up the tests removing storage objects"""
+        FileStorage.JOURNAL = cls.journal
+        storage.delete_all()
+        remove(F)
+
+    def setUp(self):
+        """starts every test from an empty snapshot"""
+        FileStorage.JOURNAL_MAX = 8388608
+        storage.delete_all()
+        self.state = State(name="Iowa")
+        self.state.save()
+
+    def test_save_appends(self):
+        """... save() appends to the journal, snapshot is untouched"""
+        with open(F, mode='r', encoding='utf-8') as f_obj:
+            snapshot = f_obj.read()
+        with open(J, mode='r', encoding='utf-8') as f_obj:
+            lines = f_obj.readlines()
+        self.assertEqual(snapshot, '{}')
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['key'],
+                         'State.{}'.format(self.state.id))
+
+    def test_reload_replays(self):
+        """... reload() replays saves and deletes on top of snapshot"""
+        other = State(name="Utah")
+        other.save()
+        self.state.name = "Idaho"
+        self.state.save()
+        other.delete()
+        storage.reload()
+        self.assertIsNone(storage.get('State', other.id))
+        self.assertEqual(storage.get('State', self.state.id).name, "Idaho")
+        self.assertEqual(storage.count('State'), 1)
+
+    def test_assigned_attribute_journaled(self):
+        """... an attribute assigned since the last save is journaled"""
+        self.state.name = "Idaho"
+        storage.save()
+        storage.reload()
+        self.assertEqual(storage.get('State', self.state.id).name, "Idaho")
+
+    def test_compaction(self):
+        """... journal is folded into the snapshot past JOURNAL_MAX"""
+        FileStorage.JOURNAL_MAX = 1
+        State(name="Maine").save()
+        self.assertFalse(path.isfile(J))
+        with open(F, mode='r', encoding='utf-8') as f_obj:
+            storage_dict = json.load(f_obj)
+        self.assertEqual(len(storage_dict), 2)
+
+    def test_close_replays_appended_records(self):
+        """... close() applies records another process appended"""
+        other = State(name="Other")
+        record = {'key': 'State.{}'.format(other.id),
+                  'obj': other.to_json(True)}
+        with open(J, mode='a', encoding='utf-8') as f_obj:
+            f_obj.write(json.dumps(record) + '\n')
+        storage.close()
+        self.assertIs(storage.get('State', self.state.id), self.state)
+        self.assertEqual(storage.get('State', other.id).name, "Other")
+
+    def test_torn_last_line(self):
+        """... a partially written last record is ignored on reload"""
+        with open(J, mode='a', encoding='utf-8') as f_obj:
+            f_obj.write('{"key": "State.torn", "obj": {"__cl')
+        storage.reload()
+        self.assertEqual(storage.count('State'), 1)
+        State(name="Vermont").save()
+        storage.reload()
+        self.assertEqual(storage.count('State'), 2)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsDirtyTracking(unittest.TestCase):
+    """testing that saves only re-serialize dirty objects"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('........ Dirty Tracking .........')
+        print('.................................\n\n')
+        cls.journal = FileStorage.JOURNAL
+        FileStorage.JOURNAL = False
+        storage.delete_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        """tidies up the tests removing storage objects"""
+        FileStorage.JOURNAL = cls.journal
+        storage.delete_all()
+        remove(F)
+
+    def test_save_marks_clean(self):
+        """... save() flushes dirty objects and marks them clean"""
+        state = State(name="Kansas")
+        state.save()
+        self.assertFalse(state.is_dirty())
+
+    def test_dirty_object_rewritten(self):
+        """... a dirty object is written again on the next save()"""
+        state = State(name="Nevada")
+        state.save()
+        state.name = "Oregon"
+        self.assertTrue(state.is_dirty())
+        storage.save()
+        with open(F, mode='r', encoding='utf-8') as f_obj:
+            storage_dict = json.load(f_obj)
+        key = 'State.{}'.format(state.id)
+        self.assertEqual(storage_dict[key]['name'], "Oregon")
+
+    def test_bm_update_unchanged_skips_save(self):
+        """... bm_update() with unchanged values does not save"""
+        state = State(name="Alaska")
+        state.save()
+        updated_at = state.updated_at
+        state.bm_update({'name': "Alaska"})
+        self.assertEqual(state.updated_at, updated_at)
+        state.bm_update({'name': "Hawaii"})
+        self.assertNotEqual(state.updated_at, updated_at)
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsDurability(unittest.TestCase):
+    """testing atomic snapshot writes and the fsync policy"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('.......... Durability ...........')
+        print('.................................\n\n')
+        cls.fsync = FileStorage.FSYNC
+        storage.delete_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        """tidies up the tests removing storage objects"""
+        FileStorage.FSYNC = cls.fsync
+        storage.delete_all()
+        remove(F)
+
+    def test_no_temp_file_left(self):
+        """... compact() renames its temporary file over the snapshot"""
+        State(name="Georgia").save()
+        storage.compact()
+        self.assertTrue(path.isfile(F))
+        self.assertEqual([f for f in listdir('./dev') if f.endswith('.tmp')],
+                         [])
+
+    def test_fsync_policies(self):
+        """... every fsync policy saves and reloads the same objects"""
+        for policy in ['always', 'never', '10']:
+            FileStorage.FSYNC = policy
+            state = State(name=policy)
+            state.save()
+            storage.reload()
+            self.assertEqual(storage.get('State', state.id).name, policy)
+
+    def test_snapshot_synced_under_interval(self):
+        """... compact() fsyncs the snapshot whatever the interval"""
+        FileStorage.FSYNC = '3600000'
+        State(name="Nebraska").save()
+        with mock.patch('os.fsync') as fsync:
+            storage.compact()
+        self.assertEqual(fsync.call_count, 2)
+        FileStorage.FSYNC = 'never'
+        with mock.patch('os.fsync') as fsync:
+            storage.compact()
+        self.assertEqual(fsync.call_count, 0)
+
+    def test_fsync_policy_checked(self):
+        """... fsync_policy() rejects what is not a policy"""
+        for policy in ['always', 'never', '10', '0.5']:
+            self.assertEqual(fsync_policy(policy), policy)
+        for policy in ['sometimes', '', '10ms']:
+            self.assertRaises(ValueError, fsync_policy, policy)
+
+    def test_empty_file_reloads_empty(self):
+        """... an empty snapshot file reloads as an empty storage"""
+        with open(F, mode='w', encoding='utf-8'):
+            pass
+        storage.reload()
+        self.assertEqual(storage.count(), 0)
+
+    def test_corrupt_file_raises(self):
+        """... a corrupt snapshot raises instead of starting empty"""
+        with open(F, mode='w', encoding='utf-8') as f_obj:
+            f_obj.write('{"State.1": {"__cl')
+        with self.assertRaises(ValueError):
+            storage.reload()
+        storage.delete_all()
+
+
+@unittest.skipIf(STORAGE_TYPE == 'db', 'skip if environ is db')
+class TestFsMultiProcess(unittest.TestCase):
+    """testing consistency between processes sharing the JSON file"""
+
+    @classmethod
+    def setUpClass(cls):
+        """sets up the class"""
+        print('\n\n.................................')
+        print('...... Testing FileStorage ......')
+        print('........ Multi Process ..........')
+        print('.................................\n\n')
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+        remove(F)
+
+    def setUp(self):
+        """starts every test from a one state storage"""
+        storage.delete_all()
+        self.state = State(name="Ohio")
+        self.state.save()
+
+    def write_other_state(self):
+        """writes a state to the file the way another process would"""
+        with open(F, mode='r', encoding='utf-8') as f_obj:
+            storage_dict = json.load(f_obj)
+        other = State(name="Other")
+        storage_dict['State.{}'.format(other.id)] = other.to_json(True)
+        with open(F, mode='w', encoding='utf-8') as f_obj:
+            json.dump(storage_dict, f_obj)
+        return other.id
+
+    def test_close_keeps_warm(self):
+        """... close() does not reload when the file did not change"""
+        storage.close()
+        self.assertIs(storage.get('State', self.state.id), self.state)
+
+    def test_close_reloads_on_change(self):
+        """... close() reloads when another process wrote the file"""
+        other_id = self.write_other_state()
+        storage.close()
+        self.assertIsNotNone(storage.get('State', other_id))
+
+    def test_reload_hooks(self):
+        """... RELOAD_HOOKS run only when another process wrote the file,
+        on close() and when a save merges its writes"""
+        calls = []
+        FileStorage.RELOAD_HOOKS.append(lambda: calls.append(1))
+        try:
+            storage.close()
+            self.assertEqual(calls, [])
+            self.write_other_state()
+            storage.close()
+            self.assertEqual(calls, [1])
+            self.write_other_state()
+            storage.compact()
+            self.assertEqual(calls, [1, 1])
+        finally:
+            FileStorage.RELOAD_HOOKS.pop()
+
+    def test_save_merges_other_writes(self):
+        """... save() keeps objects another process wrote meanwhile"""
+        other_id = self.write_other_state()
+        new_state = State(name="Mine")
+        new_state.save()
+        storage.reload()
+        self.assertIsNotNone(storage.get('State', other_id))
+        self.assertIsNotNone(storage.get('State', new_state.id))
+
+    def test_merge_keeps_assigned_attribute(self):
+        """... save() merging other writes keeps attributes assigned here"""
+        other_id = self.write_other_state()
+        self.state.name = "Iowa"
+        storage.save()
+        storage.reload()
+        self.assertIsNotNone(storage.get('State', other_id))
+        self.assertEqual(storage.get('State', self.state.id).name, "Iowa")
+
+    @unittest.skipIf(not hasattr(os, 'fork'), 'needs os.fork')
+    def test_concurrent_writers(self):
+        """... concurrent processes saving objects lose no writes"""
+        children = []
+        for _ in range(3):
+            pid = os.fork()
+            if pid == 0:
+                for i in range(10):
+                    State(name="child {}".format(i)).save()
+                os._exit(0)
+            children.append(pid)
+        for pid in children:
+            os.waitpid(pid, 0)
+        storage.reload()
+        self.assertEqual(storage.count('State'), 31)
+
+    def test_concurrent_threads(self):
+        """... threads saving objects at once lose no writes"""
+        def write():
+            for i in range(10):
+                State(name="thread {}".format(i)).save()
+        threads = [threading.Thread(target=write) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([f for f in listdir('./dev') if f.endswith('.tmp')],
+                         [])
+        storage.reload()
+        self.assertEqual(storage.count('State'), 31)
+
+
 if __name__ == '__main__':
     unittest.main
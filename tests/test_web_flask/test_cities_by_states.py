@@ -6,9 +6,15 @@ import inspect
 import pep8
 import web_flask
 import unittest
-from os import stat
+from models import storage
+from models.city import City
+from models.state import State
+from os import environ, stat
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 web_flask = __import__('web_flask.8-cities_by_states',
                        globals(), locals(), ['*'])
+STORAGE_TYPE = environ.get('HBNB_TYPE_STORAGE')
 
 
 class TestCitiesStateDocs(unittest.TestCase):
@@ -48,6 +54,43 @@ class TestCitiesStateDocs(unittest.TestCase):
         self.assertTrue(actual)
 
 
+@unittest.skipIf(STORAGE_TYPE != 'db', 'skip if environ is not db')
+class TestCitiesStateQueries(unittest.TestCase):
+    """Class for testing the SQL statements of Cities By State"""
+
+    @classmethod
+    def setUpClass(cls):
+        print('\n\n.................................')
+        print('....... Testing SQL Queries .....')
+        print('........  Cities By State ........')
+        print('.................................\n\n')
+        storage.delete_all()
+        for i in range(5):
+            a_state = State(name="State {}".format(i))
+            a_state.save()
+            City(state_id=a_state.id, name="City {}".format(i)).save()
+        storage.close()
+
+    def tearDownClass():
+        """tidies up the tests removing storage objects"""
+        storage.delete_all()
+
+    def test_statements_per_request(self):
+        """... cities of every state are loaded by a single query"""
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            """counts a statement"""
+            statements.append(statement)
+        event.listen(Engine, 'before_cursor_execute', count)
+        try:
+            response = web_flask.app.test_client().get('/cities_by_states')
+        finally:
+            event.remove(Engine, 'before_cursor_execute', count)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'City 4', response.data)
+        self.assertEqual(len(statements), 2)
+
 if __name__ == '__main__':
     """
     MAIN TESTS
@@ -20,7 +20,7 @@ def filters_list():
     """
         method to display html page 6-index.html
     """
-    states = storage.all('State').values()
+    states = storage.all('State', with_related=['cities']).values()
     amenities = storage.all('Amenity').values()
     return render_template(
         "10-hbnb_filters.html",
@@ -28,7 +28,7 @@ def hbnb_filters(the_id=None):
     """
     handles request to custom template with states, cities & amentities
     """
-    state_objs = storage.all('State').values()
+    state_objs = storage.all('State', with_related=['cities']).values()
     states = dict([state.name, state] for state in state_objs)
     amens = storage.all('Amenity').values()
     places = storage.all('Place').values()
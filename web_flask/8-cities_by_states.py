@@ -21,7 +21,7 @@ def city_state_list():
     """
         method to render states from storage
     """
-    states = storage.all('State').values()
+    states = storage.all('State', with_related=['cities']).values()
     return render_template("8-cities_by_states.html", states=states)
 
 if __name__ == '__main__':